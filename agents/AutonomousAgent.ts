@@ -18,11 +18,12 @@ import {
   TxResult,
 } from './runtime/types.js';
 
-import { StellarClient } from '../src/stellar/StellarClient.js';
+import type { StellarClient } from '../src/stellar/StellarClient.js';
 import { PolicySigner } from '../src/stellar/PolicySigner.js';
 
-import { DIDManager, CredentialManager, AgentRegistry } from '../protocols/masumi/index.js';
-import { SokosumiCoordinator } from '../protocols/sokosumi/index.js';
+import { CredentialManager, AgentRegistry } from '../protocols/masumi/index.js';
+import type { DIDManager } from '../protocols/masumi/index.js';
+import type { SokosumiCoordinator } from '../protocols/sokosumi/index.js';
 import { X402Client } from '../protocols/x402/X402Client.js';
 import { ChannelManager } from '../protocols/x402-flash/ChannelManager.js';
 
@@ -36,6 +37,14 @@ import {
 
 import { DID, AgentMetadata } from '../protocols/masumi/types.js';
 
+/**
+ * Periodic task run by the agent's shared interval timers
+ */
+interface ScheduledTask {
+  name: string;
+  run: () => Promise<void>;
+}
+
 /**
  * Autonomous Agent - fully integrated agent
  */
@@ -71,12 +80,17 @@ export class AutonomousAgent {
   private myDID?: DID;
   private isInitialized: boolean = false;
   private isRunning: boolean = false;
+  private schedules: Map<number, { timer: ReturnType<typeof setInterval>; tasks: ScheduledTask[] }> =
+    new Map();
+  // Runs in progress by task name; outlives replacing a task or stop()/start()
+  private runningTasks: Map<string, Promise<void>> = new Map();
 
   constructor(
     config: AgentConfig,
     stellarClient: StellarClient,
     didManager: DIDManager,
-    coordinator: SokosumiCoordinator
+    coordinator: SokosumiCoordinator,
+    agentRegistry?: AgentRegistry
   ) {
     // Initialize core components
     this.stellarClient = stellarClient;
@@ -103,7 +117,9 @@ export class AutonomousAgent {
       { didMethod: 'stellar', trustedIssuers: [], stellarNetwork: config.stellarNetwork },
       didManager
     );
-    this.agentRegistry = new AgentRegistry(
+    // A registry shared by the caller lets co-hosted agents reuse each
+    // other's lookups instead of each fetching counterparties on its own
+    this.agentRegistry = agentRegistry ?? new AgentRegistry(
       { didMethod: 'stellar', trustedIssuers: [], stellarNetwork: config.stellarNetwork },
       stellarClient
     );
@@ -243,6 +259,11 @@ export class AutonomousAgent {
    * Stop agent
    */
   async stop(): Promise<void> {
+    for (const { timer } of this.schedules.values()) {
+      clearInterval(timer);
+    }
+    this.schedules.clear();
+
     await this.runtime.stop();
     this.isRunning = false;
   }
@@ -428,9 +449,7 @@ export class AutonomousAgent {
    * Start loan monitoring loop
    */
   private startLoanMonitoring(): void {
-    setInterval(async () => {
-      if (!this.isRunning) return;
-
+    this.scheduleTask('loan monitoring', 60000, async () => { // Check every minute
       const duePayments = await this.loanNegotiator.checkDuePayments();
       for (const contractId of duePayments) {
         // Make payment
@@ -439,21 +458,87 @@ export class AutonomousAgent {
           await this.loanNegotiator.makeRepayment(contractId, loan.terms.principal / 12);
         }
       }
-    }, 60000); // Check every minute
+    });
   }
 
   /**
    * Start escrow monitoring loop
    */
   private startEscrowMonitoring(): void {
-    setInterval(async () => {
-      if (!this.isRunning) return;
-
+    this.scheduleTask('escrow monitoring', 60000, async () => { // Check every minute
       const expired = await this.tradingManager.checkExpiredEscrows();
       for (const contractId of expired) {
         // Request refund
         await this.tradingManager.requestRefund(contractId);
       }
-    }, 60000); // Check every minute
+    });
+  }
+
+  /**
+   * Run a task on an interval while the agent is running. Tasks with the
+   * same interval share one timer. Timers are owned by the agent and
+   * cleared on stop, so a restart does not stack a second set; scheduling
+   * a name that already exists replaces it, so a repeated start() cannot
+   * register the same loop twice.
+   */
+  private scheduleTask(name: string, intervalMs: number, run: () => Promise<void>): void {
+    this.unscheduleTask(name);
+
+    let schedule = this.schedules.get(intervalMs);
+    if (!schedule) {
+      const tasks: ScheduledTask[] = [];
+      const timer = setInterval(() => {
+        if (!this.isRunning) return;
+
+        for (const task of tasks) {
+          void this.runTask(task);
+        }
+      }, intervalMs);
+
+      schedule = { timer, tasks };
+      this.schedules.set(intervalMs, schedule);
+    }
+
+    schedule.tasks.push({ name, run });
+  }
+
+  /**
+   * Remove a scheduled task by name, stopping its timer if no other task
+   * shares it
+   */
+  private unscheduleTask(name: string): void {
+    for (const [intervalMs, schedule] of this.schedules) {
+      const index = schedule.tasks.findIndex((task) => task.name === name);
+      if (index === -1) continue;
+
+      schedule.tasks.splice(index, 1);
+      if (schedule.tasks.length === 0) {
+        clearInterval(schedule.timer);
+        this.schedules.delete(intervalMs);
+      }
+      return;
+    }
+  }
+
+  /**
+   * Run a scheduled task. A tick that fires while a run of the same name is
+   * still in progress is skipped, even if the task was replaced or the agent
+   * restarted since, so a slow run never overlaps another. A failed run is
+   * logged instead of surfacing as an unhandled rejection.
+   */
+  private async runTask(task: ScheduledTask): Promise<void> {
+    if (this.runningTasks.has(task.name)) return;
+
+    // Started on a microtask so the entry is always set before it is cleared
+    const running = Promise.resolve()
+      .then(task.run)
+      .catch((error) => {
+        console.error(`[AutonomousAgent] ${task.name} failed:`, error);
+      })
+      .finally(() => {
+        this.runningTasks.delete(task.name);
+      });
+    this.runningTasks.set(task.name, running);
+    await running;
   }
 }
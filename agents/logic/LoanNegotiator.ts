@@ -16,7 +16,7 @@ import {
   NegotiationSession,
   Agreement,
 } from '../../protocols/sokosumi/index.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 
 /**
  * Loan terms
@@ -15,7 +15,7 @@ import {
   Terms,
   NegotiationSession,
 } from '../../protocols/sokosumi/index.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 
 /**
  * Trade details
@@ -11,9 +11,18 @@ import {
   TxOutcome,
   SpendingLimits,
 } from '../runtime/types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
-import { PolicySigner } from '../../src/stellar/PolicySigner.js';
-import { MemoryManager } from '../runtime/MemoryManager.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { PolicySigner } from '../../src/stellar/PolicySigner.js';
+import type { MemoryManager } from '../runtime/MemoryManager.js';
+
+/**
+ * Confirmation polling: start fast so quick confirmations are seen early,
+ * then back off to limit Horizon load on slow ones
+ */
+const POLL_INITIAL_INTERVAL = 500;
+const POLL_MAX_INTERVAL = 3500;
+const POLL_BACKOFF = 1.5;
+const POLL_TIMEOUT = 60_000;
 
 /**
  * Spending tracker
@@ -107,9 +116,14 @@ export class TransactionExecutor {
       // Record in memory
       await this.recordTransaction(tx, result);
 
-      // Monitor transaction status
+      // Horizon submission returns once the transaction is in a closed
+      // ledger; only poll when the response did not say which one
       if (result.success) {
-        this.monitorTransaction(result.hash);
+        if (result.ledger !== undefined) {
+          await this.recordConfirmation(result);
+        } else {
+          this.monitorTransaction(result.hash);
+        }
       }
 
       return result;
@@ -222,29 +236,54 @@ export class TransactionExecutor {
     });
   }
 
+  /**
+   * Record a confirmed transaction
+   */
+  private async recordConfirmation(status: TxResult): Promise<void> {
+    await this.memoryManager.store({
+      id: `tx-confirmed-${status.hash}`,
+      timestamp: Date.now(),
+      type: 'transaction',
+      data: { hash: status.hash, status, ledger: status.ledger },
+      tags: ['transaction', 'confirmed'],
+    });
+  }
+
   /**
    * Monitor transaction status
    */
   private async monitorTransaction(hash: string): Promise<void> {
-    // Poll transaction status
-    const maxAttempts = 10;
-    const pollInterval = 1000; // 1 second
+    // One deadline covers both the stream wait and any fallback polling
+    const deadline = performance.now() + POLL_TIMEOUT;
+
+    // Wait on Horizon's transaction stream first; it reports the ledger as
+    // soon as it closes instead of up to one poll interval later
+    const streamed = await this.stellarClient.waitForTransaction(hash, this.publicKey, POLL_TIMEOUT);
+    if (streamed) {
+      if (streamed.success) {
+        await this.recordConfirmation(streamed);
+      }
+      return;
+    }
+
+    // Stream unavailable or closed early: poll with exponential backoff for
+    // whatever time the stream left
+    let interval = POLL_INITIAL_INTERVAL;
 
-    for (let attempt = 0; attempt < maxAttempts; attempt++) {
-      await new Promise((resolve) => setTimeout(resolve, pollInterval));
+    while (performance.now() + interval < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, interval));
+      interval = Math.min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL);
 
       try {
         const status = await this.stellarClient.getTransactionStatus(hash);
-        
+
         if (status.success) {
-          // Transaction confirmed
-          await this.memoryManager.store({
-            id: `tx-confirmed-${hash}`,
-            timestamp: Date.now(),
-            type: 'transaction',
-            data: { hash, status, ledger: status.ledger },
-            tags: ['transaction', 'confirmed'],
-          });
+          await this.recordConfirmation(status);
+          break;
+        }
+
+        // Lookups that miss carry an error; an unsuccessful result without one failed on-chain
+        if (!status.error) {
           break;
         }
       } catch (error) {
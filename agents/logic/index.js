@@ -1,11 +0,0 @@
-/**
- * Agent Logic
- *
- * Autonomous decision-making, risk assessment, and transaction execution.
- */
-export * from './OpportunityEvaluator.js';
-export * from './RiskAssessor.js';
-export * from './TransactionExecutor.js';
-export * from './LoanNegotiator.js';
-export * from './TradingManager.js';
-//# sourceMappingURL=index.js.map
\ No newline at end of file
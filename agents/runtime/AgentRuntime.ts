@@ -23,6 +23,7 @@ import {
   Action,
   Evaluator,
   AgentDID,
+  EvaluationResult,
 } from './types.js';
 import { MemoryManager } from './MemoryManager.js';
 import { PluginManager } from './PluginManager.js';
@@ -45,7 +46,8 @@ export class AgentRuntime {
 
   constructor(config: AgentConfig) {
     this.config = config;
-    this.memoryManager = new MemoryManager();
+    // stop() flushes memory, so record calls can skip waiting on disk
+    this.memoryManager = new MemoryManager(undefined, { writeBehind: true });
     this.pluginManager = new PluginManager();
     this.characterEngine = new CharacterEngine();
     
@@ -211,13 +213,15 @@ export class AgentRuntime {
     this.state.transactionCount++;
     this.state.lastActivity = Date.now();
 
-    // Run evaluators
+    // Run evaluators and persist their learnings in one write
+    const learnings: EvaluationResult[] = [];
     for (const evaluator of this.evaluators.values()) {
       const evaluation = await evaluator.evaluate(outcome);
       if (evaluation.shouldLearn) {
-        await this.memoryManager.recordLearning(evaluation);
+        learnings.push(evaluation);
       }
     }
+    await this.memoryManager.recordLearnings(learnings);
   }
 
   /**
@@ -328,13 +332,19 @@ export class AgentRuntime {
       character: this.character,
     };
 
-    for (const [name, provider] of this.providers) {
-      try {
-        state[name] = await provider.getData();
-      } catch (error) {
-        console.error(`Failed to get data from provider ${name}:`, error);
+    // Providers are independent (typically network reads), so query them
+    // concurrently: total latency is the slowest provider, not the sum
+    const providers = Array.from(this.providers);
+    const results = await Promise.allSettled(providers.map(([, provider]) => provider.getData()));
+
+    results.forEach((result, index) => {
+      const name = providers[index][0];
+      if (result.status === 'fulfilled') {
+        state[name] = result.value;
+      } else {
+        console.error(`Failed to get data from provider ${name}:`, result.reason);
       }
-    }
+    });
 
     return state;
   }
@@ -9,6 +9,7 @@ import {
   Transaction,
   TxOutcome,
   HistoryFilter,
+  HistoryPage,
   MemoryEntry,
   TradingOpportunity,
   Decision,
@@ -18,18 +19,71 @@ import {
 import * as fs from 'fs';
 import * as path from 'path';
 
+/**
+ * Persisted store names; each maps to `<name>.json` in the memory directory
+ */
+type StoreName = 'transactions' | 'decisions' | 'learnings';
+
+/**
+ * Stored transaction record; the same object is referenced from every index
+ */
+interface TransactionRecord {
+  tx: Transaction;
+  outcome: TxOutcome;
+}
+
+/**
+ * Timeline key. Carries the outcome status and the transaction itself so a
+ * history page is served from the timeline alone, without a lookup per row.
+ */
+interface TimelineEntry {
+  timestamp: number;
+  txId: string;
+  success: boolean;
+  tx: Transaction;
+}
+
+/**
+ * Write-behind window (opt-in): records are persisted together once this
+ * much time has passed since the first unsaved record, or once the batch
+ * fills up
+ */
+const WRITE_BEHIND_MS = 50;
+const WRITE_BATCH_SIZE = 100;
+
 /**
  * Memory manager for agent persistence
  */
 export class MemoryManager {
   private memoryPath: string;
-  private transactions: Map<string, { tx: Transaction; outcome: TxOutcome }> = new Map();
+  private writeBehind: boolean;
+  private transactions: Map<string, TransactionRecord> = new Map();
   private decisions: MemoryEntry[] = [];
   private learnings: EvaluationResult[] = [];
-  private counterpartyHistory: Map<AgentDID, any[]> = new Map();
+  private counterpartyHistory: Map<AgentDID, TransactionRecord[]> = new Map();
+  // Transaction IDs partitioned by outcome so status queries skip the other partition
+  private statusIndex: Record<'success' | 'failed', Set<string>> = {
+    success: new Set(),
+    failed: new Set(),
+  };
+  // (timestamp, txId) keys in ascending order for keyset pagination
+  private timeline: TimelineEntry[] = [];
+  // Stores changed since the last save; only these files are rewritten
+  private dirty: Record<StoreName, boolean> = { transactions: false, decisions: false, learnings: false };
+  // Tail of the save queue; saves run one after another so writes never interleave
+  private saving: Promise<void> = Promise.resolve();
+  // Records accepted since the last save, and the timer that will save them
+  private unsavedRecords: number = 0;
+  private saveTimer: NodeJS.Timeout | null = null;
 
-  constructor(memoryPath: string = './data/memory') {
+  /**
+   * By default every record call resolves once it is on disk. With
+   * `writeBehind`, records resolve as soon as they are in memory and are
+   * written in batches; the owner must call flush() before shutting down.
+   */
+  constructor(memoryPath: string = './data/memory', options: { writeBehind?: boolean } = {}) {
     this.memoryPath = memoryPath;
+    this.writeBehind = options.writeBehind ?? false;
   }
 
   /**
@@ -37,39 +91,57 @@ export class MemoryManager {
    */
   async initialize(): Promise<void> {
     // Create memory directory if it doesn't exist
-    if (!fs.existsSync(this.memoryPath)) {
-      fs.mkdirSync(this.memoryPath, { recursive: true });
-    }
+    await fs.promises.mkdir(this.memoryPath, { recursive: true });
 
     // Load existing memory
     await this.load();
   }
 
   /**
-   * Record a transaction
+   * Record a transaction. Resolves once saved unless write-behind is
+   * enabled; pass `sync: true` to save a record immediately regardless.
    */
-  async recordTransaction(tx: Transaction, outcome: TxOutcome): Promise<void> {
-    const txId = this.generateTxId(tx);
-    this.transactions.set(txId, { tx, outcome });
+  async recordTransaction(
+    tx: Transaction,
+    outcome: TxOutcome,
+    options: { sync?: boolean } = {}
+  ): Promise<void> {
+    await this.recordTransactions([{ tx, outcome }], options);
+  }
+
+  /**
+   * Record a batch of transactions with a single write to disk
+   */
+  async recordTransactions(
+    entries: Array<{ tx: Transaction; outcome: TxOutcome }>,
+    options: { sync?: boolean } = {}
+  ): Promise<void> {
+    if (entries.length === 0) {
+      return;
+    }
 
-    // Update counterparty history if applicable
-    if (tx.operations.length > 0) {
-      const op = tx.operations[0];
-      if (op.body.data.destination) {
-        const counterparty = op.body.data.destination;
-        if (!this.counterpartyHistory.has(counterparty)) {
-          this.counterpartyHistory.set(counterparty, []);
-        }
-        this.counterpartyHistory.get(counterparty)!.push({
-          tx,
-          outcome,
-          timestamp: outcome.timestamp,
-        });
+    for (const { tx, outcome } of entries) {
+      const txId = this.generateTxId(tx);
+      const previous = this.transactions.get(txId);
+      if (previous) {
+        this.removeFromTimeline(txId, previous.outcome.timestamp);
+        this.unindexCounterparty(previous);
       }
+      const record: TransactionRecord = { tx, outcome };
+      this.transactions.set(txId, record);
+      this.insertIntoTimeline({
+        timestamp: outcome.timestamp,
+        txId,
+        success: outcome.result.success,
+        tx,
+      });
+      this.indexStatus(txId, outcome);
+      this.indexCounterparty(record);
     }
+    this.dirty.transactions = true;
 
     // Persist to disk
-    await this.save();
+    await this.persist(entries.length, options.sync);
   }
 
   /**
@@ -85,15 +157,28 @@ export class MemoryManager {
     };
 
     this.decisions.push(entry);
-    await this.save();
+    this.dirty.decisions = true;
+    await this.persist(1);
   }
 
   /**
    * Record a learning
    */
   async recordLearning(evaluation: EvaluationResult): Promise<void> {
-    this.learnings.push(evaluation);
-    await this.save();
+    await this.recordLearnings([evaluation]);
+  }
+
+  /**
+   * Record a batch of learnings with a single write to disk
+   */
+  async recordLearnings(evaluations: EvaluationResult[]): Promise<void> {
+    if (evaluations.length === 0) {
+      return;
+    }
+
+    this.learnings.push(...evaluations);
+    this.dirty.learnings = true;
+    await this.persist(evaluations.length);
   }
 
   /**
@@ -101,9 +186,10 @@ export class MemoryManager {
    */
   async queryHistory(filter: HistoryFilter): Promise<Transaction[]> {
     const results: Transaction[] = [];
+    const txIds = filter.status ? this.statusIndex[filter.status] : this.transactions.keys();
 
-    for (const [_, entry] of this.transactions) {
-      const { tx, outcome } = entry;
+    for (const txId of txIds) {
+      const { tx, outcome } = this.transactions.get(txId)!;
 
       // Apply filters
       if (filter.startDate && outcome.timestamp < filter.startDate.getTime()) {
@@ -112,17 +198,89 @@ export class MemoryManager {
       if (filter.endDate && outcome.timestamp > filter.endDate.getTime()) {
         continue;
       }
-      if (filter.status === 'success' && !outcome.result.success) {
-        continue;
+
+      results.push(tx);
+    }
+
+    return results;
+  }
+
+  /**
+   * Query a page of transaction history, newest first. Pages are addressed
+   * by a (timestamp, id) cursor, so deep pages cost the same as the first.
+   * Throws if the cursor is not one returned by a previous page.
+   */
+  async queryHistoryPage(
+    filter: HistoryFilter,
+    limit: number = 50,
+    cursor?: string
+  ): Promise<HistoryPage> {
+    const transactions: Transaction[] = [];
+    const startTime = filter.startDate?.getTime();
+    const endTime = filter.endDate?.getTime();
+
+    let position =
+      endTime !== undefined ? this.timelinePosition(endTime, '\uffff') : this.timeline.length;
+    if (cursor) {
+      const separator = cursor.indexOf(':');
+      const timestamp = separator > 0 ? Number(cursor.slice(0, separator)) : NaN;
+      const txId = cursor.slice(separator + 1);
+      if (!Number.isFinite(timestamp) || !txId) {
+        throw new Error(`Invalid history cursor: ${cursor}`);
       }
-      if (filter.status === 'failed' && outcome.result.success) {
+      // A cursor never reaches past the filter's end date
+      position = Math.min(position, this.timelinePosition(timestamp, txId));
+    }
+
+    const wantSuccess = filter.status ? filter.status === 'success' : undefined;
+
+    let last: TimelineEntry | undefined;
+    for (let i = position - 1; i >= 0 && transactions.length < limit; i--) {
+      const key = this.timeline[i];
+      if (startTime !== undefined && key.timestamp < startTime) {
+        break;
+      }
+      if (wantSuccess !== undefined && key.success !== wantSuccess) {
         continue;
       }
 
-      results.push(tx);
+      transactions.push(key.tx);
+      last = key;
     }
 
-    return results;
+    return {
+      transactions,
+      nextCursor:
+        last && transactions.length === limit ? `${last.timestamp}:${last.txId}` : undefined,
+    };
+  }
+
+  /**
+   * Iterate transaction history newest first without building a result
+   * array. Safe to interleave with writes: each step resumes from the last
+   * yielded key rather than from a stale index.
+   */
+  *iterateHistory(filter: HistoryFilter = {}): Generator<Transaction> {
+    const startTime = filter.startDate?.getTime();
+    const endTime = filter.endDate?.getTime();
+    const wantSuccess = filter.status ? filter.status === 'success' : undefined;
+
+    let position =
+      endTime !== undefined ? this.timelinePosition(endTime, '\uffff') : this.timeline.length;
+
+    while (position > 0) {
+      const key = this.timeline[position - 1];
+      if (startTime !== undefined && key.timestamp < startTime) {
+        return;
+      }
+
+      if (wantSuccess === undefined || key.success === wantSuccess) {
+        yield key.tx;
+        position = this.timelinePosition(key.timestamp, key.txId);
+      } else {
+        position--;
+      }
+    }
   }
 
   /**
@@ -154,6 +312,10 @@ export class MemoryManager {
     this.decisions = [];
     this.learnings = [];
     this.counterpartyHistory.clear();
+    this.statusIndex.success.clear();
+    this.statusIndex.failed.clear();
+    this.timeline = [];
+    this.markAllDirty();
     await this.save();
   }
 
@@ -161,6 +323,7 @@ export class MemoryManager {
    * Flush memory to disk
    */
   async flush(): Promise<void> {
+    this.markAllDirty();
     await this.save();
   }
 
@@ -171,75 +334,257 @@ export class MemoryManager {
    */
   private async load(): Promise<void> {
     try {
-      const transactionsPath = path.join(this.memoryPath, 'transactions.json');
-      const decisionsPath = path.join(this.memoryPath, 'decisions.json');
-      const learningsPath = path.join(this.memoryPath, 'learnings.json');
-
-      if (fs.existsSync(transactionsPath)) {
-        const data = fs.readFileSync(transactionsPath, 'utf-8');
-        const txArray = JSON.parse(data);
-        this.transactions = new Map(txArray);
+      // Read all stores concurrently instead of one blocking read after another
+      const [txData, decisionsData, learningsData] = await Promise.all([
+        this.readStore('transactions.json'),
+        this.readStore('decisions.json'),
+        this.readStore('learnings.json'),
+      ]);
+
+      if (txData !== null) {
+        this.transactions = new Map(JSON.parse(txData));
       }
 
-      if (fs.existsSync(decisionsPath)) {
-        const data = fs.readFileSync(decisionsPath, 'utf-8');
-        this.decisions = JSON.parse(data);
+      if (decisionsData !== null) {
+        this.decisions = JSON.parse(decisionsData);
       }
 
-      if (fs.existsSync(learningsPath)) {
-        const data = fs.readFileSync(learningsPath, 'utf-8');
-        this.learnings = JSON.parse(data);
+      if (learningsData !== null) {
+        this.learnings = JSON.parse(learningsData);
       }
 
-      // Rebuild counterparty history from transactions
-      this.rebuildCounterpartyHistory();
+      // Rebuild indexes from transactions
+      this.rebuildIndexes();
     } catch (error) {
       console.error('Failed to load memory:', error);
     }
   }
 
   /**
-   * Save memory to disk
+   * Read a store file, or null if it does not exist yet
    */
-  private async save(): Promise<void> {
+  private async readStore(fileName: string): Promise<string | null> {
     try {
-      const transactionsPath = path.join(this.memoryPath, 'transactions.json');
-      const decisionsPath = path.join(this.memoryPath, 'decisions.json');
-      const learningsPath = path.join(this.memoryPath, 'learnings.json');
+      return await fs.promises.readFile(path.join(this.memoryPath, fileName), 'utf-8');
+    } catch (error: any) {
+      if (error.code === 'ENOENT') {
+        return null;
+      }
+      throw error;
+    }
+  }
+
+  /**
+   * Save now, or leave the records to the write-behind batch when enabled
+   */
+  private async persist(records: number, sync: boolean = false): Promise<void> {
+    if (sync || !this.writeBehind) {
+      await this.save();
+    } else {
+      this.scheduleSave(records);
+    }
+  }
+
+  /**
+   * Batch recent records into one save instead of writing on every call
+   */
+  private scheduleSave(records: number): void {
+    this.unsavedRecords += records;
+
+    if (this.unsavedRecords >= WRITE_BATCH_SIZE) {
+      void this.save();
+    } else if (!this.saveTimer) {
+      this.saveTimer = setTimeout(() => {
+        void this.save();
+      }, WRITE_BEHIND_MS);
+    }
+  }
 
+  /**
+   * Save changed stores to disk; each file is written independently so a
+   * decision or learning does not rewrite the full transaction history
+   */
+  private save(): Promise<void> {
+    if (this.saveTimer) {
+      clearTimeout(this.saveTimer);
+      this.saveTimer = null;
+    }
+    this.unsavedRecords = 0;
+
+    this.saving = this.saving.then(() => this.writeDirtyStores());
+    return this.saving;
+  }
+
+  /**
+   * Snapshot dirty stores and write them without blocking the event loop
+   */
+  private async writeDirtyStores(): Promise<void> {
+    const writes: Promise<void>[] = [];
+
+    // Stores are machine-read only; compact JSON skips indentation work and
+    // shrinks the files that every save rewrites
+
+    if (this.dirty.transactions) {
       // Convert Map to array for JSON serialization
       const txArray = Array.from(this.transactions.entries());
-      fs.writeFileSync(transactionsPath, JSON.stringify(txArray, null, 2));
-      fs.writeFileSync(decisionsPath, JSON.stringify(this.decisions, null, 2));
-      fs.writeFileSync(learningsPath, JSON.stringify(this.learnings, null, 2));
+      writes.push(this.writeStore('transactions', JSON.stringify(txArray)));
+    }
+
+    if (this.dirty.decisions) {
+      writes.push(this.writeStore('decisions', JSON.stringify(this.decisions)));
+    }
+
+    if (this.dirty.learnings) {
+      writes.push(this.writeStore('learnings', JSON.stringify(this.learnings)));
+    }
+
+    await Promise.all(writes);
+  }
+
+  /**
+   * Write one store file; a failed write leaves the store dirty for the next save
+   */
+  private async writeStore(store: StoreName, data: string): Promise<void> {
+    this.dirty[store] = false;
+
+    try {
+      await fs.promises.writeFile(path.join(this.memoryPath, `${store}.json`), data);
     } catch (error) {
+      this.dirty[store] = true;
       console.error('Failed to save memory:', error);
     }
   }
 
   /**
-   * Rebuild counterparty history from transactions
+   * Mark every store as changed
    */
-  private rebuildCounterpartyHistory(): void {
+  private markAllDirty(): void {
+    this.dirty.transactions = true;
+    this.dirty.decisions = true;
+    this.dirty.learnings = true;
+  }
+
+  /**
+   * Rebuild status and counterparty indexes from transactions
+   */
+  private rebuildIndexes(): void {
     this.counterpartyHistory.clear();
+    this.statusIndex.success.clear();
+    this.statusIndex.failed.clear();
+    this.timeline = [];
+
+    for (const [txId, entry] of this.transactions) {
+      this.timeline.push({
+        timestamp: entry.outcome.timestamp,
+        txId,
+        success: entry.outcome.result.success,
+        tx: entry.tx,
+      });
+      this.indexStatus(txId, entry.outcome);
+      this.indexCounterparty(entry);
+    }
+
+    this.timeline.sort((a, b) => a.timestamp - b.timestamp || (a.txId < b.txId ? -1 : 1));
+  }
 
-    for (const [_, entry] of this.transactions) {
-      const { tx, outcome } = entry;
-      if (tx.operations.length > 0) {
-        const op = tx.operations[0];
-        if (op.body.data.destination) {
-          const counterparty = op.body.data.destination;
-          if (!this.counterpartyHistory.has(counterparty)) {
-            this.counterpartyHistory.set(counterparty, []);
-          }
-          this.counterpartyHistory.get(counterparty)!.push({
-            tx,
-            outcome,
-            timestamp: outcome.timestamp,
-          });
-        }
+  /**
+   * Index of the first timeline key at or after (timestamp, txId)
+   */
+  private timelinePosition(timestamp: number, txId: string): number {
+    let low = 0;
+    let high = this.timeline.length;
+
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      const key = this.timeline[mid];
+      if (key.timestamp < timestamp || (key.timestamp === timestamp && key.txId < txId)) {
+        low = mid + 1;
+      } else {
+        high = mid;
       }
     }
+
+    return low;
+  }
+
+  /**
+   * Insert a key into the timeline, keeping it ordered (appends in the common case)
+   */
+  private insertIntoTimeline(entry: TimelineEntry): void {
+    const { timestamp, txId } = entry;
+    const last = this.timeline[this.timeline.length - 1];
+    if (!last || last.timestamp < timestamp || (last.timestamp === timestamp && last.txId < txId)) {
+      this.timeline.push(entry);
+      return;
+    }
+
+    this.timeline.splice(this.timelinePosition(timestamp, txId), 0, entry);
+  }
+
+  /**
+   * Remove a key from the timeline
+   */
+  private removeFromTimeline(txId: string, timestamp: number): void {
+    const index = this.timelinePosition(timestamp, txId);
+    const key = this.timeline[index];
+    if (key && key.timestamp === timestamp && key.txId === txId) {
+      this.timeline.splice(index, 1);
+    }
+  }
+
+  /**
+   * Place a transaction in the status partition matching its outcome
+   */
+  private indexStatus(txId: string, outcome: TxOutcome): void {
+    if (outcome.result.success) {
+      this.statusIndex.failed.delete(txId);
+      this.statusIndex.success.add(txId);
+    } else {
+      this.statusIndex.success.delete(txId);
+      this.statusIndex.failed.add(txId);
+    }
+  }
+
+  /**
+   * Add a transaction to the counterparty history index
+   */
+  private indexCounterparty(record: TransactionRecord): void {
+    const { tx } = record;
+    if (tx.operations.length === 0) {
+      return;
+    }
+
+    const counterparty = tx.operations[0].body.data.destination;
+    if (!counterparty) {
+      return;
+    }
+
+    let history = this.counterpartyHistory.get(counterparty);
+    if (!history) {
+      history = [];
+      this.counterpartyHistory.set(counterparty, history);
+    }
+    // Share the stored record rather than allocating a copy per index entry
+    history.push(record);
+  }
+
+  /**
+   * Remove a replaced record from the counterparty history index
+   */
+  private unindexCounterparty(record: TransactionRecord): void {
+    const counterparty = record.tx.operations[0]?.body.data.destination;
+    const history = counterparty ? this.counterpartyHistory.get(counterparty) : undefined;
+    if (!history) {
+      return;
+    }
+
+    const index = history.indexOf(record);
+    if (index !== -1) {
+      history.splice(index, 1);
+    }
+    if (history.length === 0) {
+      this.counterpartyHistory.delete(counterparty);
+    }
   }
 
   /**
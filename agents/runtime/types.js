@@ -1,7 +0,0 @@
-/**
- * Agent Runtime Type Definitions
- *
- * Core types for the ElizaOS-based agent runtime system.
- */
-export {};
-//# sourceMappingURL=types.js.map
\ No newline at end of file
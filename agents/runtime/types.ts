@@ -147,6 +147,7 @@ export interface SignedTransaction {
   transaction: Transaction;
   signature: string;
   hash: string;
+  envelopeXdr?: string; // Signed envelope (base64); resubmitted as-is on retry
 }
 
 /**
@@ -156,6 +157,8 @@ export interface TxResult {
   success: boolean;
   hash: string;
   ledger?: number;
+  /** Account that submitted the transaction, when known */
+  sourceAccount?: string;
   error?: string;
 }
 
@@ -182,6 +185,14 @@ export interface HistoryFilter {
   status?: 'success' | 'failed';
 }
 
+/**
+ * Page of transaction history, newest first
+ */
+export interface HistoryPage {
+  transactions: Transaction[];
+  nextCursor?: string; // Opaque keyset cursor; pass back to fetch the next page
+}
+
 /**
  * Memory entry
  */
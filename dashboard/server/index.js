@@ -9,7 +9,20 @@ const app = express();
 const PORT = process.env.PORT || 3001;
 const NODE_ENV = process.env.NODE_ENV || 'development';
 
-app.use(cors());
+// Explicit CORS policy: fixed method/header lists and a cached preflight.
+// CORS_ORIGINS (comma-separated) restricts origins; unset allows any.
+const allowedOrigins = process.env.CORS_ORIGINS
+  ? new Set(process.env.CORS_ORIGINS.split(',').map((origin) => origin.trim()))
+  : null;
+
+app.use(cors({
+  origin: allowedOrigins
+    ? (origin, callback) => callback(null, !origin || allowedOrigins.has(origin))
+    : '*',
+  methods: ['GET', 'POST', 'OPTIONS'],
+  allowedHeaders: ['Content-Type', 'Authorization'],
+  maxAge: 600,
+}));
 app.use(express.json());
 
 // Mock data store
@@ -17,6 +17,9 @@ export const CONTRACT_ADDRESSES = {
 // Stellar Expert URLs for transaction viewing
 export const STELLAR_EXPERT_URL = 'https://stellar.expert/explorer/testnet';
 
+// Transaction link prefix, built once rather than on every rendered row
+const STELLAR_EXPERT_TX_URL = `${STELLAR_EXPERT_URL}/tx/`;
+
 export function getStellarExpertTxUrl(hash: string): string {
-  return `${STELLAR_EXPERT_URL}/tx/${hash}`;
+  return STELLAR_EXPERT_TX_URL + hash;
 }
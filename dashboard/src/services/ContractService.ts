@@ -7,6 +7,7 @@ import {
   TransactionOutcome,
 } from '../types';
 import { STELLAR_CONFIG, CONTRACT_ADDRESSES } from '../config/stellar';
+import { getHorizonServer, getSorobanServer } from './stellarServers';
 
 /**
  * ContractService interfaces with deployed Stellar smart contracts
@@ -20,8 +21,8 @@ export class ContractService {
   private networkPassphrase: string;
 
   constructor() {
-    this.server = new StellarSdk.Horizon.Server(STELLAR_CONFIG.horizonUrl);
-    this.sorobanServer = new StellarSdk.SorobanRpc.Server(STELLAR_CONFIG.sorobanRpcUrl);
+    this.server = getHorizonServer();
+    this.sorobanServer = getSorobanServer();
     this.networkPassphrase = STELLAR_CONFIG.networkPassphrase;
   }
 
@@ -7,6 +7,7 @@ import {
 import { STELLAR_CONFIG } from '../config/stellar';
 import { WalletService } from './WalletService';
 import { ContractService } from './ContractService';
+import { getHorizonServer } from './stellarServers';
 
 /**
  * TransactionService handles transaction creation, signing, submission, and status tracking
@@ -21,7 +22,7 @@ export class TransactionService {
   private contractService: ContractService;
 
   constructor(walletService: WalletService, contractService: ContractService) {
-    this.server = new StellarSdk.Horizon.Server(STELLAR_CONFIG.horizonUrl);
+    this.server = getHorizonServer();
     this.networkPassphrase = STELLAR_CONFIG.networkPassphrase;
     this.walletService = walletService;
     this.contractService = contractService;
@@ -152,7 +153,8 @@ export class TransactionService {
    * 
    * @param hash - Transaction hash
    * @param maxAttempts - Maximum polling attempts (default: 10)
-   * @param interval - Polling interval in ms (default: 2000)
+   * @param interval - Longest wait between polls in ms (default: 2000); waits
+   *   start at 500ms and grow 1.5x so fast confirmations are seen early
    * @returns Transaction status
    */
   async pollTransactionStatus(
@@ -160,6 +162,8 @@ export class TransactionService {
     maxAttempts: number = 10,
     interval: number = 2000
   ): Promise<TransactionStatus> {
+    let delay = Math.min(500, interval);
+
     for (let attempt = 0; attempt < maxAttempts; attempt++) {
       try {
         const transaction = await this.server.transactions().transaction(hash).call();
@@ -181,7 +185,8 @@ export class TransactionService {
       } catch (error) {
         // Transaction not found yet, continue polling
         if (attempt < maxAttempts - 1) {
-          await this.sleep(interval);
+          await this.sleep(delay);
+          delay = Math.min(delay * 1.5, interval);
         }
       }
     }
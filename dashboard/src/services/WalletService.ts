@@ -3,7 +3,7 @@ import { WalletProvider, WalletConnection, WalletState, WalletProviderType } fro
 import { FreighterAdapter } from '../adapters/FreighterAdapter';
 import { AlbedoAdapter } from '../adapters/AlbedoAdapter';
 import { StorageService } from './StorageService';
-import { STELLAR_CONFIG } from '../config/stellar';
+import { getHorizonServer } from './stellarServers';
 
 /**
  * WalletService manages wallet connections, disconnections, and state
@@ -31,7 +31,7 @@ export class WalletService {
       error: null,
     };
 
-    this.server = new StellarSdk.Horizon.Server(STELLAR_CONFIG.horizonUrl);
+    this.server = getHorizonServer();
   }
 
   /**
@@ -0,0 +1,28 @@
+import * as StellarSdk from '@stellar/stellar-sdk';
+import { STELLAR_CONFIG } from '../config/stellar';
+
+let horizonServer: StellarSdk.Horizon.Server | null = null;
+let sorobanServer: StellarSdk.SorobanRpc.Server | null = null;
+
+/**
+ * Get the Horizon server shared by all dashboard services
+ *
+ * One instance means one HTTP client, so requests from every service reuse
+ * the same connections instead of each paying its own handshake.
+ */
+export function getHorizonServer(): StellarSdk.Horizon.Server {
+  if (!horizonServer) {
+    horizonServer = new StellarSdk.Horizon.Server(STELLAR_CONFIG.horizonUrl);
+  }
+  return horizonServer;
+}
+
+/**
+ * Get the Soroban RPC server shared by all dashboard services
+ */
+export function getSorobanServer(): StellarSdk.SorobanRpc.Server {
+  if (!sorobanServer) {
+    sorobanServer = new StellarSdk.SorobanRpc.Server(STELLAR_CONFIG.sorobanRpcUrl);
+  }
+  return sorobanServer;
+}
@@ -10,7 +10,7 @@ import {
   AgentRegistryEntry,
   MasumiConfig,
 } from './types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 import { TxResult } from '../../agents/runtime/types.js';
 
 /**
@@ -20,6 +20,8 @@ export class AgentRegistry {
   private config: MasumiConfig;
   private stellarClient: StellarClient;
   private registry: Map<DID, AgentRegistryEntry> = new Map();
+  // capability -> DIDs advertising it, kept in step with the registry
+  private capabilityIndex: Map<string, Set<DID>> = new Map();
   private nftCounter: number = 0;
 
   constructor(config: MasumiConfig, stellarClient: StellarClient) {
@@ -61,6 +63,7 @@ export class AgentRegistry {
 
     // Store in registry
     this.registry.set(did, entry);
+    this.indexCapabilities(entry);
 
     return entry;
   }
@@ -79,6 +82,7 @@ export class AgentRegistry {
     const onChainEntry = await this.fetchFromChain(did);
     if (onChainEntry) {
       this.registry.set(did, onChainEntry);
+      this.indexCapabilities(onChainEntry);
       return onChainEntry;
     }
 
@@ -116,8 +120,14 @@ export class AgentRegistry {
       throw new Error(`Failed to update agent: ${txResult.error}`);
     }
 
-    // Update registry
+    // Update registry. Unindex the entry stored now, not the one read before
+    // the await: a concurrent update may have replaced it in the meantime
+    const current = this.registry.get(did);
+    if (current) {
+      this.unindexCapabilities(current);
+    }
     this.registry.set(did, updatedEntry);
+    this.indexCapabilities(updatedEntry);
 
     return updatedEntry;
   }
@@ -137,8 +147,12 @@ export class AgentRegistry {
       throw new Error(`Failed to deregister agent: ${txResult.error}`);
     }
 
-    // Remove from registry
-    this.registry.delete(did);
+    // Remove from registry, unindexing whatever entry is stored now
+    const current = this.registry.get(did);
+    if (current) {
+      this.unindexCapabilities(current);
+      this.registry.delete(did);
+    }
   }
 
   /**
@@ -146,11 +160,13 @@ export class AgentRegistry {
    */
   async searchByCapability(capability: string): Promise<AgentRegistryEntry[]> {
     const results: AgentRegistryEntry[] = [];
+    const dids = this.capabilityIndex.get(capability);
+    if (!dids) {
+      return results;
+    }
 
-    for (const entry of this.registry.values()) {
-      if (entry.metadata.capabilities.includes(capability)) {
-        results.push(entry);
-      }
+    for (const did of dids) {
+      results.push(this.registry.get(did)!);
     }
 
     return results;
@@ -176,12 +192,41 @@ export class AgentRegistry {
    * Get agents by reputation score
    */
   async getTopAgents(minScore: number, limit: number = 10): Promise<AgentRegistryEntry[]> {
-    const agents = Array.from(this.registry.values())
-      .filter((entry) => entry.metadata.reputation.score >= minScore)
-      .sort((a, b) => b.metadata.reputation.score - a.metadata.reputation.score)
-      .slice(0, limit);
+    // Bounded top-k selection: keep only the best `limit` entries in score
+    // order instead of sorting every matching agent
+    const top: AgentRegistryEntry[] = [];
+    if (limit <= 0) {
+      return top;
+    }
+
+    for (const entry of this.registry.values()) {
+      const score = entry.metadata.reputation.score;
+      if (score < minScore) {
+        continue;
+      }
+      if (top.length === limit && score <= top[limit - 1].metadata.reputation.score) {
+        continue;
+      }
 
-    return agents;
+      // Insert after any equal scores so ties keep registration order
+      let low = 0;
+      let high = top.length;
+      while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (top[mid].metadata.reputation.score >= score) {
+          low = mid + 1;
+        } else {
+          high = mid;
+        }
+      }
+      top.splice(low, 0, entry);
+
+      if (top.length > limit) {
+        top.pop();
+      }
+    }
+
+    return top;
   }
 
   /**
@@ -216,21 +261,57 @@ export class AgentRegistry {
    * Get registry statistics
    */
   getStatistics() {
-    const agents = Array.from(this.registry.values());
-    
+    // Aggregate in one pass over the registry without intermediate arrays
+    let reputationSum = 0;
+    const capabilities = new Set<string>();
+
+    for (const entry of this.registry.values()) {
+      reputationSum += entry.metadata.reputation.score;
+      for (const capability of entry.metadata.capabilities) {
+        capabilities.add(capability);
+      }
+    }
+
+    const totalAgents = this.registry.size;
+
     return {
-      totalAgents: agents.length,
-      averageReputation:
-        agents.reduce((sum, a) => sum + a.metadata.reputation.score, 0) /
-        agents.length || 0,
-      capabilitiesCount: new Set(
-        agents.flatMap((a) => a.metadata.capabilities)
-      ).size,
+      totalAgents,
+      averageReputation: reputationSum / totalAgents || 0,
+      capabilitiesCount: capabilities.size,
     };
   }
 
   // Private methods
 
+  /**
+   * Add an entry to the capability index
+   */
+  private indexCapabilities(entry: AgentRegistryEntry): void {
+    for (const capability of entry.metadata.capabilities) {
+      let dids = this.capabilityIndex.get(capability);
+      if (!dids) {
+        dids = new Set();
+        this.capabilityIndex.set(capability, dids);
+      }
+      dids.add(entry.did);
+    }
+  }
+
+  /**
+   * Remove an entry from the capability index
+   */
+  private unindexCapabilities(entry: AgentRegistryEntry): void {
+    for (const capability of entry.metadata.capabilities) {
+      const dids = this.capabilityIndex.get(capability);
+      if (dids) {
+        dids.delete(entry.did);
+        if (dids.size === 0) {
+          this.capabilityIndex.delete(capability);
+        }
+      }
+    }
+  }
+
   /**
    * Generate NFT token ID
    */
@@ -339,5 +420,6 @@ export class AgentRegistry {
    */
   clearCache(): void {
     this.registry.clear();
+    this.capabilityIndex.clear();
   }
 }
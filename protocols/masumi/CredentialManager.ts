@@ -37,14 +37,18 @@ export class CredentialManager {
     request: CredentialIssuanceRequest,
     issuerSecretKey: string
   ): Promise<VerifiableCredential> {
+    // Resolve issuer and subject concurrently; cache misses go to the registry
+    const [issuerResolution, subjectResolution] = await Promise.all([
+      this.didManager.resolveDID(issuerDID),
+      this.didManager.resolveDID(request.subject),
+    ]);
+
     // Verify issuer DID exists
-    const issuerResolution = await this.didManager.resolveDID(issuerDID);
     if (!issuerResolution.didDocument) {
       throw new Error(`Issuer DID not found: ${issuerDID}`);
     }
 
     // Verify subject DID exists
-    const subjectResolution = await this.didManager.resolveDID(request.subject);
     if (!subjectResolution.didDocument) {
       throw new Error(`Subject DID not found: ${request.subject}`);
     }
@@ -206,9 +210,11 @@ export class CredentialManager {
         };
       }
 
-      // Verify all credentials in presentation
-      for (const credential of presentation.verifiableCredential) {
-        const result = await this.verifyCredential(credential);
+      // Verify all credentials in presentation concurrently
+      const results = await Promise.all(
+        presentation.verifiableCredential.map((credential) => this.verifyCredential(credential))
+      );
+      for (const result of results) {
         if (!result.verified) {
           return {
             verified: false,
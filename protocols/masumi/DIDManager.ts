@@ -13,7 +13,7 @@ import {
   ServiceEndpoint,
   MasumiConfig,
 } from './types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 
 /**
  * DID Manager for creating, resolving, and updating DIDs
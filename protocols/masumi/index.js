@@ -1,10 +0,0 @@
-/**
- * Masumi Identity and Trust Layer
- *
- * W3C DID/VC standards implementation for agent identity.
- */
-export * from './types.js';
-export * from './DIDManager.js';
-export * from './CredentialManager.js';
-export * from './AgentRegistry.js';
-//# sourceMappingURL=index.js.map
\ No newline at end of file
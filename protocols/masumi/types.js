@@ -1,7 +0,0 @@
-/**
- * Masumi Protocol Type Definitions
- *
- * Types for the Masumi decentralized identity and verifiable credentials protocol.
- */
-export {};
-//# sourceMappingURL=types.js.map
\ No newline at end of file
@@ -79,14 +79,11 @@ export class ServiceRegistry {
 
     // Filter by reputation
     if (query.minReputation !== undefined) {
-      const filteredResults: ServiceDescription[] = [];
-      for (const service of results) {
-        const reputation = await this.getReputation(service.agentDID);
-        if (reputation && reputation.overallScore >= query.minReputation) {
-          filteredResults.push(service);
-        }
-      }
-      results = filteredResults;
+      // Reputations are in memory; read them directly instead of awaiting per service
+      results = results.filter((s) => {
+        const reputation = this.reputations.get(s.agentDID);
+        return reputation !== undefined && reputation.overallScore >= query.minReputation!;
+      });
     }
 
     // Filter by availability
@@ -265,18 +262,26 @@ export class ServiceRegistry {
    * Get statistics
    */
   getStatistics() {
-    const services = Array.from(this.services.values());
-    const reputations = Array.from(this.reputations.values());
+    // Aggregate in one pass per map without intermediate arrays
+    let availableServices = 0;
+    const serviceTypes = new Set<string>();
+    for (const service of this.services.values()) {
+      if (service.availability.status === 'available') {
+        availableServices++;
+      }
+      serviceTypes.add(service.serviceType);
+    }
+
+    let reputationSum = 0;
+    for (const reputation of this.reputations.values()) {
+      reputationSum += reputation.overallScore;
+    }
 
     return {
-      totalServices: services.length,
-      availableServices: services.filter(
-        (s) => s.availability.status === 'available'
-      ).length,
-      serviceTypes: new Set(services.map((s) => s.serviceType)).size,
-      averageReputation:
-        reputations.reduce((sum, r) => sum + r.overallScore, 0) /
-        reputations.length || 0,
+      totalServices: this.services.size,
+      availableServices,
+      serviceTypes: serviceTypes.size,
+      averageReputation: reputationSum / this.reputations.size || 0,
     };
   }
 
@@ -28,6 +28,7 @@ export class SokosumiCoordinator {
   private serviceRegistry: ServiceRegistry;
   private negotiationEngine: NegotiationEngine;
   private resourceAllocator: ResourceAllocator;
+  private cleanupTimers: ReturnType<typeof setInterval>[] = [];
 
   constructor(config: SokosumiConfig) {
     this.config = config;
@@ -297,20 +298,32 @@ export class SokosumiCoordinator {
    */
   private startCleanupTasks(): void {
     // Clean up expired negotiations every minute
-    setInterval(() => {
+    this.cleanupTimers.push(setInterval(() => {
       this.negotiationEngine.cleanupExpiredSessions();
-    }, 60000);
+    }, 60000));
 
     // Clean up expired resource allocations every minute
-    setInterval(() => {
-      this.resourceAllocator.cleanupExpiredAllocations();
-    }, 60000);
+    this.cleanupTimers.push(setInterval(() => {
+      this.resourceAllocator.cleanupExpiredAllocations().catch((error) => {
+        console.error('[SokosumiCoordinator] Allocation cleanup failed:', error);
+      });
+    }, 60000));
+
+    // Housekeeping alone should not keep the process alive
+    for (const timer of this.cleanupTimers) {
+      timer.unref();
+    }
   }
 
   /**
    * Shutdown coordinator
    */
   async shutdown(): Promise<void> {
+    for (const timer of this.cleanupTimers) {
+      clearInterval(timer);
+    }
+    this.cleanupTimers = [];
+
     // Clear all data
     this.serviceRegistry.clear();
     this.negotiationEngine.clear();
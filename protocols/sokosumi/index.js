@@ -1,11 +0,0 @@
-/**
- * Sokosumi Coordination Protocol
- *
- * Agent coordination, service discovery, and resource allocation.
- */
-export * from './types.js';
-export * from './ServiceRegistry.js';
-export * from './NegotiationEngine.js';
-export * from './ResourceAllocator.js';
-export * from './SokosumiCoordinator.js';
-//# sourceMappingURL=index.js.map
\ No newline at end of file
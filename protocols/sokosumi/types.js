@@ -1,7 +0,0 @@
-/**
- * Sokosumi Coordination Protocol Types
- *
- * Agent coordination, service discovery, and resource allocation.
- */
-export {};
-//# sourceMappingURL=types.js.map
\ No newline at end of file
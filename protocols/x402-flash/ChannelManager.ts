@@ -14,7 +14,7 @@ import {
   ChannelManagerState,
 } from './types.js';
 import { FlashChannel } from './FlashChannel.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 
 /**
  * Channel Manager for coordinating multiple channels
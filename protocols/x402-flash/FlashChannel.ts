@@ -16,7 +16,7 @@ import {
   ChannelDispute,
   ChannelConfig,
 } from './types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
 import { TxResult } from '../../agents/runtime/types.js';
 
 /**
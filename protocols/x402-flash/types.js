@@ -1,7 +0,0 @@
-/**
- * x402-Flash Payment Channel Types
- *
- * Off-chain payment channel types for sub-100ms micropayments.
- */
-export {};
-//# sourceMappingURL=types.js.map
\ No newline at end of file
@@ -8,13 +8,61 @@
 import {
   Response402,
   PaymentProof,
+  UnsignedPaymentProof,
   PaymentResponse,
   X402ClientConfig,
   ResourceRequest,
   ResourceResponse,
 } from './types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
-import { ChannelManager } from '../x402-flash/ChannelManager.js';
+import type { Keypair } from '@stellar/stellar-sdk';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { ChannelManager } from '../x402-flash/ChannelManager.js';
+import { TTLCache } from '../../src/utils/TTLCache.js';
+import { CircuitBreakerManager } from '../../src/utils/CircuitBreaker.js';
+import { RetryHandler } from '../../src/utils/RetryHandler.js';
+import { proofMessage } from './signing.js';
+
+/**
+ * Proofs older than this are rejected by servers, so there is no point
+ * holding on to them
+ */
+const PROOF_CACHE_TTL = 24 * 60 * 60 * 1000;
+const PROOF_CACHE_SIZE = 1000;
+
+/**
+ * After repeated connection failures an origin is skipped for this long
+ * instead of every request waiting on it
+ */
+const ORIGIN_BREAKER_TIMEOUT = 30_000;
+
+/**
+ * Transient failures are retried quickly (~100ms, then ~200ms) so a blip
+ * does not fail the request outright. Idempotent requests retry gateway
+ * errors and any connection failure, including resets of pooled keep-alive
+ * sockets. Other requests (e.g. the POST carrying a payment proof) may
+ * already have been consumed by the server, so they only retry failures
+ * that guarantee nothing was sent.
+ */
+const HTTP_RETRY_CONFIG = { maxRetries: 2, baseDelay: 100, maxDelay: 2_000 };
+const IDEMPOTENT_METHODS = new Set(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE']);
+const RETRYABLE_STATUSES = new Set([502, 503, 504]);
+const UNSENT_ERRORS = ['ECONNREFUSED', 'UND_ERR_CONNECT_TIMEOUT', 'ENOTFOUND', 'EAI_AGAIN'];
+const IDEMPOTENT_RETRY_ERRORS = [
+  ...UNSENT_ERRORS,
+  'ECONNRESET',
+  'EPIPE',
+  'ETIMEDOUT',
+  'ENETUNREACH',
+  'UND_ERR_SOCKET',
+  'EHTTPSTATUS',
+];
+
+/**
+ * Check for a header regardless of the caller's capitalization
+ */
+function hasHeader(headers: Record<string, string> | undefined, name: string): boolean {
+  return headers !== undefined && Object.keys(headers).some((key) => key.toLowerCase() === name);
+}
 
 /**
  * x402 Client implementation
@@ -23,8 +71,12 @@ export class X402Client {
   private config: X402ClientConfig;
   private stellarClient: StellarClient;
   private channelManager?: ChannelManager;
-  private paymentCache: Map<string, PaymentProof> = new Map();
+  private paymentCache = new TTLCache<string, PaymentProof>(PROOF_CACHE_TTL, PROOF_CACHE_SIZE);
   private secretKey?: string;
+  private keypair?: Promise<Keypair>;
+  private breakers = new CircuitBreakerManager();
+  private idempotentRetry = new RetryHandler({ ...HTTP_RETRY_CONFIG, retryableErrors: IDEMPOTENT_RETRY_ERRORS });
+  private unsentRetry = new RetryHandler({ ...HTTP_RETRY_CONFIG, retryableErrors: UNSENT_ERRORS });
 
   constructor(
     config: X402ClientConfig,
@@ -41,8 +93,16 @@ export class X402Client {
    * Make HTTP request with automatic 402 handling
    */
   async request(request: ResourceRequest): Promise<ResourceResponse> {
+    // Serialize the body once; the paid retry resends the same bytes
+    // and headers. Without an explicit type fetch labels a string body
+    // text/plain.
+    const body = request.body ? JSON.stringify(request.body) : undefined;
+    if (body !== undefined && !hasHeader(request.headers, 'content-type')) {
+      request = { ...request, headers: { ...request.headers, 'content-type': 'application/json' } };
+    }
+
     // Make initial request
-    const response = await this.makeHttpRequest(request);
+    const response = await this.makeHttpRequest(request, body);
 
     // Check if payment required
     if (response.statusCode === 402) {
@@ -63,7 +123,7 @@ export class X402Client {
       const proof = await this.makePayment(response402);
       
       // Retry request with payment proof
-      return await this.retryWithPayment(request, response402.requestId, proof);
+      return await this.retryWithPayment(request, body, response402.requestId, proof);
     }
 
     return response;
@@ -87,9 +147,7 @@ export class X402Client {
     }
 
     // Get public key from secret
-    const StellarSdk = await import('@stellar/stellar-sdk');
-    const keypair = StellarSdk.Keypair.fromSecret(this.secretKey);
-    const publicKey = keypair.publicKey();
+    const publicKey = await this.getPublicKey(this.secretKey);
 
     // Check balance
     const balance = await this.stellarClient.getBalance(publicKey);
@@ -103,6 +161,25 @@ export class X402Client {
     return amount <= maxPayment;
   }
 
+  /**
+   * Derive the payer keypair once and reuse it for every 402
+   */
+  private getKeypair(secretKey: string): Promise<Keypair> {
+    if (!this.keypair) {
+      this.keypair = import('@stellar/stellar-sdk').then((StellarSdk) =>
+        StellarSdk.Keypair.fromSecret(secretKey)
+      );
+    }
+    return this.keypair;
+  }
+
+  /**
+   * Get the payer public key
+   */
+  private async getPublicKey(secretKey: string): Promise<string> {
+    return (await this.getKeypair(secretKey)).publicKey();
+  }
+
   /**
    * Make payment for resource
    */
@@ -146,12 +223,11 @@ export class X402Client {
     }
 
     // Create payment proof
-    const proof: PaymentProof = {
+    const proof = await this.signProof(requestId, {
       type: 'on-chain',
       transactionHash: txResult.hash,
       timestamp: Date.now(),
-      signature: await this.signProof(txResult.hash),
-    };
+    });
 
     // Cache proof
     this.paymentCache.set(requestId, proof);
@@ -191,12 +267,11 @@ export class X402Client {
     const signedState = await this.channelManager.makePayment(channelId, amount);
 
     // Create payment proof
-    const proof: PaymentProof = {
+    const proof = await this.signProof(requestId, {
       type: 'channel',
       channelState: signedState,
       timestamp: Date.now(),
-      signature: await this.signProof(signedState.channelId),
-    };
+    });
 
     // Cache proof
     this.paymentCache.set(requestId, proof);
@@ -209,6 +284,7 @@ export class X402Client {
    */
   private async retryWithPayment(
     request: ResourceRequest,
+    body: string | undefined,
     requestId: string,
     proof: PaymentProof
   ): Promise<ResourceResponse> {
@@ -220,10 +296,7 @@ export class X402Client {
     };
 
     // Retry request
-    const response = await this.makeHttpRequest({
-      ...request,
-      headers,
-    });
+    const response = await this.makeHttpRequest({ ...request, headers }, body);
 
     return response;
   }
@@ -231,15 +304,59 @@ export class X402Client {
   /**
    * Make HTTP request
    */
-  private async makeHttpRequest(request: ResourceRequest): Promise<ResourceResponse> {
+  private async makeHttpRequest(
+    request: ResourceRequest,
+    encodedBody: string | undefined
+  ): Promise<ResourceResponse> {
     try {
-      const response = await fetch(request.url, {
-        method: request.method,
-        headers: request.headers,
-        body: request.body ? JSON.stringify(request.body) : undefined,
+      // One breaker per origin so an unreachable resource server fails
+      // fast without affecting requests to healthy ones
+      const origin = new URL(request.url).origin;
+      const breaker = this.breakers.getBreaker(origin, {
+        timeout: ORIGIN_BREAKER_TIMEOUT,
       });
+      const idempotent = IDEMPOTENT_METHODS.has((request.method ?? 'GET').toUpperCase());
+      const retryHandler = idempotent ? this.idempotentRetry : this.unsentRetry;
+
+      let response: Response;
+      try {
+        response = await retryHandler.execute(async () => {
+          try {
+            return await breaker.execute(async () => {
+              const fetched = await fetch(request.url, {
+                method: request.method,
+                headers: request.headers,
+                body: encodedBody,
+              });
+              if (idempotent && RETRYABLE_STATUSES.has(fetched.status)) {
+                throw Object.assign(new Error(`HTTP ${fetched.status}`), {
+                  code: 'EHTTPSTATUS',
+                  response: fetched,
+                });
+              }
+              return fetched;
+            });
+          } catch (error: any) {
+            // fetch reports socket errors as TypeError('fetch failed') with the
+            // errno on its cause. Surface that code so only connection errors
+            // are retried; anything else, including an open breaker, fails now.
+            if (error && !('code' in error)) {
+              error.code = error.cause?.code ?? 'EREQUEST';
+            }
+            throw error;
+          }
+        }, `x402 ${request.method} ${origin}`);
+      } catch (error: any) {
+        // Retries exhausted on a gateway error: return the last response as is
+        if (!(error?.response instanceof Response)) {
+          throw error;
+        }
+        response = error.response;
+      }
 
-      const body = await response.json().catch(() => ({}));
+      // Empty responses have nothing to decode; skip the parse-and-throw path
+      const empty = response.status === 204 || response.headers.get('content-length') === '0';
+      const body = empty ? {} : await response.json().catch(() => ({}));
 
       return {
         statusCode: response.status,
@@ -252,12 +369,20 @@ export class X402Client {
   }
 
   /**
-   * Sign payment proof
+   * Sign payment proof with the payer key so servers can check it locally
    */
-  private async signProof(data: string): Promise<string> {
-    // In production, this would use proper cryptographic signing
-    // For now, return a simple signature
-    return `sig-${data}-${Date.now()}`;
+  private async signProof(requestId: string, proof: UnsignedPaymentProof): Promise<PaymentProof> {
+    if (!this.secretKey) {
+      throw new Error('Secret key required for payment');
+    }
+
+    const keypair = await this.getKeypair(this.secretKey);
+
+    return {
+      ...proof,
+      payer: keypair.publicKey(),
+      signature: keypair.sign(proofMessage(requestId, proof)).toString('base64'),
+    };
   }
 
   /**
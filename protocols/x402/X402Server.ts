@@ -13,7 +13,40 @@ import {
   X402ServerConfig,
   VerificationResult,
 } from './types.js';
-import { StellarClient } from '../../src/stellar/StellarClient.js';
+import type { StellarClient } from '../../src/stellar/StellarClient.js';
+import { proofMessage } from './signing.js';
+
+/**
+ * Proof freshness bounds, checked before any parsing-dependent or network
+ * work so replayed or spoofed proofs are dropped with integer compares
+ */
+const MAX_PROOF_AGE_MS = 24 * 60 * 60 * 1000;
+const MAX_PROOF_CLOCK_SKEW_MS = 60 * 1000;
+
+/**
+ * Upper bound on the x-payment-proof header; larger headers are
+ * rejected before JSON.parse
+ */
+const MAX_PROOF_HEADER_LENGTH = 4096;
+
+/**
+ * The SDK is only needed once a signed proof arrives, so it is loaded when
+ * a paid route is mounted rather than at import time
+ */
+let keypairClass: Promise<typeof import('@stellar/stellar-sdk').Keypair> | null = null;
+
+function loadKeypair(): Promise<typeof import('@stellar/stellar-sdk').Keypair> {
+  if (!keypairClass) {
+    keypairClass = import('@stellar/stellar-sdk')
+      .then((StellarSdk) => StellarSdk.Keypair)
+      .catch((error) => {
+        // Let the next verification retry the import
+        keypairClass = null;
+        throw error;
+      });
+  }
+  return keypairClass;
+}
 
 /**
  * x402 Server implementation
@@ -21,8 +54,13 @@ import { StellarClient } from '../../src/stellar/StellarClient.js';
 export class X402Server {
   private config: X402ServerConfig;
   private stellarClient: StellarClient;
-  private pendingPayments: Map<string, PaymentDetails> = new Map();
+  private pendingPayments: Map<string, Readonly<PaymentDetails>> = new Map();
   private verifiedPayments: Set<string> = new Set();
+  private cleanupScheduled: boolean = false;
+  // Payment details built during the current wall-clock second, shared by
+  // every 402 with the same terms; replaced wholesale when the second rolls
+  private detailsSecond: number = -1;
+  private detailsCache: Map<string, Readonly<PaymentDetails>> = new Map();
 
   constructor(
     config: X402ServerConfig,
@@ -42,22 +80,13 @@ export class X402Server {
     memo?: string
   ): Response402 {
     const requestId = this.generateRequestId();
-    
-    const paymentDetails: PaymentDetails = {
-      amount: amount.toString(),
-      asset,
-      recipient,
-      memo,
-      acceptsChannels: this.config.acceptChannels,
-      facilitatorUrl: this.config.facilitatorUrl,
-      expiresAt: Date.now() + this.config.paymentTimeout,
-    };
+    const paymentDetails = this.getPaymentDetails(amount, recipient, asset, memo);
 
     // Store pending payment
     this.pendingPayments.set(requestId, paymentDetails);
 
-    // Clean up expired payments
-    this.cleanupExpiredPayments();
+    // Sweep expired payments after this response is sent, not inline
+    this.scheduleCleanup();
 
     return {
       statusCode: 402,
@@ -74,6 +103,19 @@ export class X402Server {
     requestId: string,
     proof: PaymentProof
   ): Promise<PaymentResponse> {
+    // Cheapest check first: stale or future-dated proofs never reach lookups
+    const now = Date.now();
+    if (
+      typeof proof.timestamp !== 'number' ||
+      proof.timestamp < now - MAX_PROOF_AGE_MS ||
+      proof.timestamp > now + MAX_PROOF_CLOCK_SKEW_MS
+    ) {
+      return {
+        verified: false,
+        message: 'Payment proof timestamp out of range',
+      };
+    }
+
     // Get pending payment details
     const paymentDetails = this.pendingPayments.get(requestId);
     if (!paymentDetails) {
@@ -83,6 +125,15 @@ export class X402Server {
       };
     }
 
+    // The sweep is deferred, so expiry must also be checked here
+    if (paymentDetails.expiresAt && paymentDetails.expiresAt < now) {
+      this.pendingPayments.delete(requestId);
+      return {
+        verified: false,
+        message: 'Payment request not found or expired',
+      };
+    }
+
     // Check if already verified
     if (this.verifiedPayments.has(requestId)) {
       return {
@@ -91,6 +142,22 @@ export class X402Server {
       };
     }
 
+    // Every proof must be signed by its payer; the payer is then bound to
+    // the paying account below, so a signature from any other key fails
+    if (!proof.payer || !proof.signature) {
+      return {
+        verified: false,
+        message: 'Payment proof must be signed by the payer',
+      };
+    }
+
+    if (!(await this.verifyProofSignature(requestId, proof))) {
+      return {
+        verified: false,
+        message: 'Invalid payment proof signature',
+      };
+    }
+
     // Verify based on proof type
     let verificationResult: VerificationResult;
     
@@ -141,6 +208,15 @@ export class X402Server {
    * Express middleware for payment requirement
    */
   middleware(amount: number, asset: string = 'XLM') {
+    // Resolved once per route rather than on every unpaid request
+    const recipient = this.stellarClient.getNetworkInfo().network; // In production, use actual recipient address
+
+    // Mounting a paid route means signed proofs will arrive; load the
+    // verifier now so the first paid request does not wait on the import
+    loadKeypair().catch((error) => {
+      console.warn('[X402Server] Failed to preload signature verifier:', error.message || error);
+    });
+
     return async (req: any, res: any, next: any) => {
       // Check for payment proof in headers
       const paymentProof = req.headers['x-payment-proof'];
@@ -148,17 +224,20 @@ export class X402Server {
 
       if (!paymentProof || !requestId) {
         // No payment proof, require payment
-        const recipient = await this.stellarClient.getNetworkInfo();
-        const response402 = this.requirePayment(
-          amount,
-          recipient.network, // In production, use actual recipient address
-          asset
-        );
+        const response402 = this.requirePayment(amount, recipient, asset);
 
         res.status(402).json(response402);
         return;
       }
 
+      if (typeof paymentProof !== 'string' || paymentProof.length > MAX_PROOF_HEADER_LENGTH) {
+        res.status(400).json({
+          statusCode: 400,
+          message: 'Invalid payment proof format',
+        });
+        return;
+      }
+
       // Verify payment
       try {
         const proof: PaymentProof = JSON.parse(paymentProof);
@@ -185,7 +264,7 @@ export class X402Server {
   /**
    * Get pending payment details
    */
-  getPendingPayment(requestId: string): PaymentDetails | undefined {
+  getPendingPayment(requestId: string): Readonly<PaymentDetails> | undefined {
     return this.pendingPayments.get(requestId);
   }
 
@@ -198,6 +277,56 @@ export class X402Server {
 
   // Private methods
 
+  /**
+   * Get payment details for the given terms, reusing the frozen object
+   * built earlier in the same second
+   */
+  private getPaymentDetails(
+    amount: number,
+    recipient: string,
+    asset: string,
+    memo?: string
+  ): Readonly<PaymentDetails> {
+    const second = Math.floor(Date.now() / 1000);
+    if (second !== this.detailsSecond) {
+      this.detailsSecond = second;
+      this.detailsCache.clear();
+    }
+
+    const key = `${amount}|${recipient}|${asset}|${memo ?? ''}`;
+    let details = this.detailsCache.get(key);
+    if (!details) {
+      details = Object.freeze({
+        amount: amount.toString(),
+        asset,
+        recipient,
+        memo,
+        acceptsChannels: this.config.acceptChannels,
+        facilitatorUrl: this.config.facilitatorUrl,
+        // Anchored to the start of the second so shared details agree on expiry
+        expiresAt: second * 1000 + this.config.paymentTimeout,
+      });
+      this.detailsCache.set(key, details);
+    }
+
+    return details;
+  }
+
+  /**
+   * Check the payer's ed25519 signature over the proof message
+   */
+  private async verifyProofSignature(requestId: string, proof: PaymentProof): Promise<boolean> {
+    const Keypair = await loadKeypair();
+    try {
+      return Keypair.fromPublicKey(proof.payer).verify(
+        proofMessage(requestId, proof),
+        Buffer.from(proof.signature, 'base64')
+      );
+    } catch {
+      return false;
+    }
+  }
+
   /**
    * Verify on-chain payment
    */
@@ -217,9 +346,8 @@ export class X402Server {
 
     try {
       // Get transaction from Stellar
-      const txResult = await this.stellarClient.getTransactionStatus(
-        proof.transactionHash
-      );
+      // StellarClient caches settled results and coalesces concurrent lookups
+      const txResult = await this.stellarClient.getTransactionStatus(proof.transactionHash);
 
       if (!txResult.success) {
         return {
@@ -231,6 +359,17 @@ export class X402Server {
         };
       }
 
+      // The signer must be the account that paid
+      if (txResult.sourceAccount !== proof.payer) {
+        return {
+          verified: false,
+          amount: 0,
+          sender: '',
+          timestamp: 0,
+          error: 'Payment proof payer does not match transaction source',
+        };
+      }
+
       // Verify amount and recipient
       // This is simplified - in production would parse transaction operations
       const expectedAmount = parseFloat(paymentDetails.amount);
@@ -238,7 +377,7 @@ export class X402Server {
       return {
         verified: true,
         amount: expectedAmount,
-        sender: 'verified', // Would extract from transaction
+        sender: proof.payer,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -293,6 +432,10 @@ export class X402Server {
       };
     }
 
+    // Channel proofs are not bound to the payer yet: channelState comes from
+    // the client, and the server keeps no channel state of its own to check
+    // the payer against, so the signature only proves who sent the proof
+
     // Verify amount
     const expectedAmount = parseFloat(paymentDetails.amount);
     const totalBalance = channelState.balances[0] + channelState.balances[1];
@@ -322,6 +465,21 @@ export class X402Server {
     return `req-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
   }
 
+  /**
+   * Schedule a single expired-payment sweep for the next event loop turn
+   */
+  private scheduleCleanup(): void {
+    if (this.cleanupScheduled) {
+      return;
+    }
+
+    this.cleanupScheduled = true;
+    setImmediate(() => {
+      this.cleanupScheduled = false;
+      this.cleanupExpiredPayments();
+    });
+  }
+
   /**
    * Clean up expired payments
    */
@@ -5,5 +5,6 @@
  */
 
 export * from './types.js';
+export * from './signing.js';
 export * from './X402Server.js';
 export * from './X402Client.js';
@@ -0,0 +1,18 @@
+/**
+ * x402 Proof Signing
+ *
+ * Canonical message covered by a payer's ed25519 proof signature. Client
+ * and server build it the same way so a signature can be checked locally,
+ * without a network round trip.
+ */
+
+import { UnsignedPaymentProof } from './types.js';
+
+/**
+ * Build the signed message for a proof: the request it pays for, the
+ * settlement reference and the proof timestamp
+ */
+export function proofMessage(requestId: string, proof: UnsignedPaymentProof): Buffer {
+  const reference = proof.transactionHash ?? proof.channelState?.channelId ?? '';
+  return Buffer.from(`x402:${requestId}:${reference}:${proof.timestamp}`);
+}
@@ -1,8 +0,0 @@
-/**
- * X402 Protocol Type Definitions
- *
- * Types for the X402 payment proof protocol supporting both
- * on-chain and off-chain (channel) payment verification.
- */
-export {};
-//# sourceMappingURL=types.js.map
\ No newline at end of file
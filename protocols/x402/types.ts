@@ -13,8 +13,17 @@ export interface PaymentProof {
   timestamp: number;
   transactionHash?: string;
   channelState?: ChannelState;
+  /** Payer's Stellar public key (G...); must be the paying account */
+  payer: string;
+  /** Base64 ed25519 signature by the payer over the proof message */
+  signature: string;
 }
 
+/**
+ * Payment proof before the payer has signed it
+ */
+export type UnsignedPaymentProof = Omit<PaymentProof, 'payer' | 'signature'>;
+
 /**
  * State channel information for off-chain payments
  */
@@ -180,6 +180,43 @@ describe('AgentManager', () => {
 
       await expect(agentManager.initialize(configs)).rejects.toThrow('Initialization failed');
     });
+
+    it('should stop and not register started agents if another agent fails', async () => {
+      const config = (id: string): AgentConfigWithId => ({
+        id,
+        name: `Test ${id}`,
+        characterFile: 'test-character.json',
+        plugins: [],
+        stellarNetwork: 'testnet',
+        riskTolerance: 0.5,
+        spendingLimits: {
+          maxSingleTransaction: 1000,
+          dailyLimit: 5000,
+          weeklyLimit: 20000,
+        },
+      });
+
+      const startedAgent = {
+        initialize: vi.fn().mockResolvedValue(undefined),
+        stop: vi.fn().mockResolvedValue(undefined),
+      };
+      const failingAgent = {
+        initialize: vi.fn().mockRejectedValue(new Error('Initialization failed')),
+        stop: vi.fn().mockResolvedValue(undefined),
+      };
+
+      vi.mocked(AutonomousAgent)
+        .mockImplementationOnce(() => startedAgent as any)
+        .mockImplementationOnce(() => failingAgent as any);
+
+      await expect(
+        agentManager.initialize([config('agent-1'), config('agent-2')])
+      ).rejects.toThrow('Initialization failed');
+
+      expect(startedAgent.stop).toHaveBeenCalled();
+      expect(agentManager.getAgentCount()).toBe(0);
+      expect(agentManager.getAgentStatus('agent-1')).toBeNull();
+    });
   });
 
   describe('getAgents', () => {
@@ -5,9 +5,10 @@
  */
 
 import { AutonomousAgent } from '../agents/AutonomousAgent.js';
-import { StellarClient } from './stellar/StellarClient.js';
-import { DIDManager } from '../protocols/masumi/index.js';
-import { SokosumiCoordinator } from '../protocols/sokosumi/index.js';
+import type { StellarClient } from './stellar/StellarClient.js';
+import { AgentRegistry } from '../protocols/masumi/index.js';
+import type { DIDManager } from '../protocols/masumi/index.js';
+import type { SokosumiCoordinator } from '../protocols/sokosumi/index.js';
 import type { AgentConfig } from '../agents/runtime/types.js';
 
 /**
@@ -53,6 +54,8 @@ export class AgentManager {
   private stellarClient: StellarClient;
   private didManager: DIDManager;
   private coordinator: SokosumiCoordinator;
+  // One shared registry per Stellar network, created on first use
+  private agentRegistries: Map<AgentConfig['stellarNetwork'], AgentRegistry> = new Map();
 
   constructor(
     stellarClient: StellarClient,
@@ -68,35 +71,45 @@ export class AgentManager {
   }
 
   /**
-   * Initialize agents from configuration
+   * Initialize agents from configuration. Agents start concurrently, so
+   * their registration round trips overlap instead of queuing one behind
+   * another. All or nothing: if any agent fails, the ones that started are
+   * stopped and none are registered before the first error is rethrown.
    */
   async initialize(configs: AgentConfigWithId[]): Promise<void> {
-    for (const config of configs) {
-      try {
-        // Store configuration
-        this.agentConfigs.set(config.id, config);
-
-        // Create agent instance
-        const agent = new AutonomousAgent(
-          config,
-          this.stellarClient,
-          this.didManager,
-          this.coordinator
-        );
-
-        // Initialize agent
-        await agent.initialize();
-
-        // Store agent
-        this.agents.set(config.id, agent);
-        this.agentStartTimes.set(config.id, Date.now());
-
-        console.log(`[AgentManager] Initialized agent: ${config.id} (${config.name})`);
-      } catch (error) {
-        console.error(`[AgentManager] Failed to initialize agent ${config.id}:`, error);
-        throw error;
-      }
+    const results = await Promise.allSettled(
+      configs.map((config) => this.initializeAgent(config))
+    );
+
+    const failure = results.find(
+      (result): result is PromiseRejectedResult => result.status === 'rejected'
+    );
+    if (failure) {
+      await Promise.all(
+        results.map(async (result, index) => {
+          const config = configs[index];
+          if (result.status === 'rejected') {
+            console.error(`[AgentManager] Failed to initialize agent ${config.id}:`, result.reason);
+            return;
+          }
+
+          try {
+            await result.value.stop();
+          } catch (error) {
+            console.error(`[AgentManager] Failed to stop agent ${config.id}:`, error);
+          }
+        })
+      );
+      throw failure.reason;
     }
+
+    results.forEach((result, index) => {
+      const config = configs[index];
+      this.agents.set(config.id, (result as PromiseFulfilledResult<AutonomousAgent>).value);
+      this.agentConfigs.set(config.id, config);
+      this.agentStartTimes.set(config.id, Date.now());
+      console.log(`[AgentManager] Initialized agent: ${config.id} (${config.name})`);
+    });
   }
 
   /**
@@ -243,4 +256,34 @@ export class AgentManager {
   getAgentCount(): number {
     return this.agents.size;
   }
+
+  // Private methods
+
+  /**
+   * Create and initialize one agent
+   */
+  private async initializeAgent(config: AgentConfigWithId): Promise<AutonomousAgent> {
+    // Agents on the same network share a registry, like the client and DID manager
+    let agentRegistry = this.agentRegistries.get(config.stellarNetwork);
+    if (!agentRegistry) {
+      agentRegistry = new AgentRegistry(
+        { didMethod: 'stellar', trustedIssuers: [], stellarNetwork: config.stellarNetwork },
+        this.stellarClient
+      );
+      this.agentRegistries.set(config.stellarNetwork, agentRegistry);
+    }
+
+    // Create agent instance
+    const agent = new AutonomousAgent(
+      config,
+      this.stellarClient,
+      this.didManager,
+      this.coordinator,
+      agentRegistry
+    );
+
+    // Initialize agent
+    await agent.initialize();
+    return agent;
+  }
 }
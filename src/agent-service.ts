@@ -4,8 +4,11 @@
  * Manages the autonomous agent lifecycle and integrates with the HTTP server.
  */
 
-import { AutonomousAgent } from '../agents/AutonomousAgent.js';
+import type { AutonomousAgent } from '../agents/AutonomousAgent.js';
 import { CygnusServer } from './server.js';
+import { StellarClient } from './stellar/StellarClient.js';
+import { DIDManager } from '../protocols/masumi/index.js';
+import { SokosumiCoordinator } from '../protocols/sokosumi/index.js';
 import type { AgentConfig } from '../agents/runtime/types.js';
 
 export interface AgentServiceConfig {
@@ -14,6 +17,8 @@ export interface AgentServiceConfig {
     port: number;
     host: string;
   };
+  /** Run the autonomous agent in this process (disabled on extra HTTP workers) */
+  runAgent?: boolean;
 }
 
 /**
@@ -25,9 +30,24 @@ export class AgentService {
   private config: AgentServiceConfig;
   private isRunning: boolean = false;
 
+  // Long-lived clients shared by the HTTP server and the agent for the process lifetime
+  private stellarClient: StellarClient;
+  private didManager: DIDManager;
+  private coordinator: SokosumiCoordinator;
+
   constructor(config: AgentServiceConfig) {
     this.config = config;
-    this.server = new CygnusServer(config.server);
+    this.stellarClient = new StellarClient({ network: config.agent.stellarNetwork, warmup: true });
+    this.didManager = new DIDManager(
+      { didMethod: 'stellar', trustedIssuers: [], stellarNetwork: config.agent.stellarNetwork },
+      this.stellarClient
+    );
+    this.coordinator = new SokosumiCoordinator({
+      negotiationTimeout: 300,
+      maxConcurrentNegotiations: 10,
+      reputationThreshold: 0.5,
+    });
+    this.server = new CygnusServer(config.server, this.stellarClient);
   }
 
   /**
@@ -45,9 +65,22 @@ export class AgentService {
       // Start HTTP server
       await this.server.start();
 
-      // Initialize and start autonomous agent
+      if (this.config.runAgent === false) {
+        this.isRunning = true;
+        console.log('[AgentService] Started successfully (HTTP only)');
+        return;
+      }
+
+      // Initialize and start autonomous agent. Loaded on demand: the agent
+      // logic, runtime and payment protocols are unused on HTTP-only workers
       console.log('[AgentService] Initializing autonomous agent...');
-      this.agent = new AutonomousAgent(this.config.agent);
+      const { AutonomousAgent } = await import('../agents/AutonomousAgent.js');
+      this.agent = new AutonomousAgent(
+        this.config.agent,
+        this.stellarClient,
+        this.didManager,
+        this.coordinator
+      );
       await this.agent.initialize();
       
       console.log('[AgentService] Starting autonomous agent...');
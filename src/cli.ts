@@ -3,10 +3,150 @@
  * Project Cygnus CLI
  */
 
+import cluster from 'cluster';
+import type { Worker } from 'cluster';
+import { availableParallelism } from 'os';
 import { initialize, getStatus, VERSION, NAME } from './index.js';
-import { AgentService } from './agent-service.js';
+import type { AgentService } from './agent-service.js';
 
 let agentService: AgentService | null = null;
+let shuttingDown = false;
+
+/**
+ * How long the primary waits for workers to finish their own graceful
+ * shutdown before killing them outright
+ */
+const WORKER_SHUTDOWN_TIMEOUT = 10_000;
+
+/**
+ * Crashed workers are restarted after a delay that doubles with each recent
+ * crash. More than MAX_RESTARTS crashes inside RESTART_WINDOW means the
+ * workers cannot start (bad config, port in use), so the primary gives up.
+ */
+const RESTART_DELAY = 1_000;
+const MAX_RESTART_DELAY = 30_000;
+const MAX_RESTARTS = 5;
+const RESTART_WINDOW = 60_000;
+
+/**
+ * Resolve the number of HTTP worker processes from CYGNUS_WORKERS
+ * ('auto' uses every available core; unset keeps a single process)
+ */
+function resolveWorkerCount(): number {
+  const raw = process.env.CYGNUS_WORKERS;
+  if (!raw) {
+    return 1;
+  }
+  if (raw === 'auto') {
+    return availableParallelism();
+  }
+  const count = parseInt(raw, 10);
+  return Number.isFinite(count) && count > 0 ? count : 1;
+}
+
+/**
+ * Fork HTTP workers sharing the listening socket. Only one worker runs the
+ * autonomous agent so its monitoring loops are not duplicated per core;
+ * a replacement for a crashed worker inherits the same role.
+ */
+function startCluster(workers: number): void {
+  console.log(`[CLI] Starting ${workers} workers...`);
+
+  const roles = new Map<number, string>();
+  const fork = (runAgent: string) => {
+    const worker = cluster.fork({ CYGNUS_RUN_AGENT: runAgent });
+    roles.set(worker.id, runAgent);
+  };
+
+  for (let i = 0; i < workers; i++) {
+    fork(i === 0 ? '1' : '0');
+  }
+
+  let crashes: number[] = [];
+  cluster.on('exit', (worker, code, signal) => {
+    const runAgent = roles.get(worker.id) ?? '0';
+    roles.delete(worker.id);
+    if (shuttingDown) {
+      return;
+    }
+
+    const now = Date.now();
+    crashes = crashes.filter((time) => now - time < RESTART_WINDOW);
+    crashes.push(now);
+    if (crashes.length > MAX_RESTARTS) {
+      console.error(`[CLI] Workers crashed ${crashes.length} times within ${RESTART_WINDOW}ms, giving up`);
+      void shutdown('SIGTERM', 1);
+      return;
+    }
+
+    const delay = Math.min(RESTART_DELAY * 2 ** (crashes.length - 1), MAX_RESTART_DELAY);
+    console.error(`[CLI] Worker ${worker.process.pid} exited (${signal || code}), restarting in ${delay}ms...`);
+    setTimeout(() => {
+      if (!shuttingDown) {
+        fork(runAgent);
+      }
+    }, delay);
+  });
+}
+
+/**
+ * Signal every worker and wait for them to exit, killing any that are
+ * still running after WORKER_SHUTDOWN_TIMEOUT
+ */
+async function stopWorkers(signal: NodeJS.Signals): Promise<void> {
+  const workers = Object.values(cluster.workers ?? {}).filter((worker): worker is Worker => worker !== undefined);
+
+  await Promise.all(
+    workers.map(
+      (worker) =>
+        new Promise<void>((resolve) => {
+          if (worker.isDead()) {
+            resolve();
+            return;
+          }
+
+          const timer = setTimeout(() => {
+            console.warn(`[CLI] Worker ${worker.process.pid} did not exit in time, killing`);
+            worker.process.kill('SIGKILL');
+          }, WORKER_SHUTDOWN_TIMEOUT);
+
+          worker.once('exit', () => {
+            clearTimeout(timer);
+            resolve();
+          });
+          // Signal the process directly so the worker runs its own shutdown
+          // handler instead of being disconnected first
+          worker.process.kill(signal);
+        })
+    )
+  );
+}
+
+/**
+ * Graceful shutdown: workers (in cluster mode) and the agent service are
+ * stopped before the process exits
+ */
+async function shutdown(signal: NodeJS.Signals, exitCode: number = 0): Promise<void> {
+  if (shuttingDown) {
+    return;
+  }
+  shuttingDown = true;
+
+  if (cluster.isPrimary) {
+    await stopWorkers(signal);
+  }
+
+  if (agentService) {
+    await agentService.stop();
+  }
+
+  // Flush buffered error log writes; already loaded by initialize()
+  const { globalErrorLogger } = await import('./utils/ErrorLogger.js');
+  await globalErrorLogger.close();
+
+  console.log('[CLI] Shutdown complete');
+  process.exit(exitCode);
+}
 
 async function main() {
   const args = process.argv.slice(2);
@@ -25,6 +165,13 @@ async function main() {
     case 'start':
     case 'serve':
       const network = (args[1] as 'testnet' | 'mainnet') || 'testnet';
+      const workers = resolveWorkerCount();
+
+      if (workers > 1 && cluster.isPrimary) {
+        startCluster(workers);
+        await new Promise(() => {});
+        break;
+      }
       
       // Initialize system
       await initialize({
@@ -34,7 +181,10 @@ async function main() {
 
       // Start agent service
       console.log('\n[CLI] Starting agent service...\n');
-      
+
+      // Loaded on demand: it pulls in the agent, protocols and Stellar SDK,
+      // which status/help/init and the cluster primary never need
+      const { AgentService } = await import('./agent-service.js');
       agentService = new AgentService({
         agent: {
           characterFile: './agents/characters/example-trader.json',
@@ -51,6 +201,7 @@ async function main() {
           port: parseInt(process.env.PORT || '3402'),
           host: process.env.HOST || '0.0.0.0',
         },
+        runAgent: process.env.CYGNUS_RUN_AGENT !== '0',
       });
 
       await agentService.start();
@@ -93,6 +244,7 @@ async function main() {
       console.log('\nEnvironment Variables:');
       console.log('  PORT      HTTP server port (default: 3402)');
       console.log('  HOST      HTTP server host (default: 0.0.0.0)');
+      console.log('  CYGNUS_WORKERS  HTTP worker processes, number or "auto" (default: 1)');
       break;
   }
 
@@ -102,27 +254,12 @@ async function main() {
 }
 
 // Graceful shutdown
-process.on('SIGINT', async () => {
-  console.log('\n\n[CLI] Received SIGINT, shutting down gracefully...');
-  
-  if (agentService) {
-    await agentService.stop();
-  }
-  
-  console.log('[CLI] Shutdown complete');
-  process.exit(0);
-});
-
-process.on('SIGTERM', async () => {
-  console.log('\n\n[CLI] Received SIGTERM, shutting down gracefully...');
-  
-  if (agentService) {
-    await agentService.stop();
-  }
-  
-  console.log('[CLI] Shutdown complete');
-  process.exit(0);
-});
+for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+  process.on(signal, () => {
+    console.log(`\n\n[CLI] Received ${signal}, shutting down gracefully...`);
+    void shutdown(signal);
+  });
+}
 
 main().catch(error => {
   console.error('Error:', error);
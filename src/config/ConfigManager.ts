@@ -7,6 +7,7 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import { NETWORKS } from '../stellar/network.js';
 
 export type Environment = 'testnet' | 'mainnet' | 'development';
 
@@ -80,8 +81,23 @@ export interface SystemConfig {
   monitoring: MonitoringConfig;
 }
 
+/**
+ * Recursively freeze a configuration tree so the loaded config can be
+ * shared by reference without defensive copies
+ */
+function deepFreeze<T>(value: T): Readonly<T> {
+  if (value && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.freeze(value);
+    for (const child of Object.values(value)) {
+      deepFreeze(child);
+    }
+  }
+  return value;
+}
+
 export class ConfigManager {
   private config: SystemConfig | null = null;
+  private loading: Promise<SystemConfig> | null = null;
   private configPath: string;
 
   constructor(environment?: Environment) {
@@ -90,9 +106,31 @@ export class ConfigManager {
   }
 
   /**
-   * Load configuration
+   * Load configuration. The file and environment are read once; later
+   * calls return the cached result (use reload() to re-read).
    */
   async load(): Promise<SystemConfig> {
+    if (!this.loading) {
+      this.loading = this.readConfig().catch((error) => {
+        this.loading = null;
+        throw error;
+      });
+    }
+    return this.loading;
+  }
+
+  /**
+   * Re-read configuration from file and environment
+   */
+  async reload(): Promise<SystemConfig> {
+    this.loading = null;
+    return this.load();
+  }
+
+  /**
+   * Read, merge and validate configuration
+   */
+  private async readConfig(): Promise<SystemConfig> {
     // Try to load from file
     if (fs.existsSync(this.configPath)) {
       const fileContent = fs.readFileSync(this.configPath, 'utf-8');
@@ -109,6 +147,9 @@ export class ConfigManager {
     // Validate configuration
     this.validate();
 
+    // Loaded config is immutable; reload() builds a fresh tree
+    deepFreeze(this.config);
+
     console.log(`[ConfigManager] Configuration loaded for ${this.config.environment}`);
 
     return this.config;
@@ -306,31 +347,11 @@ export class ConfigManager {
    * Get default Stellar configuration for environment
    */
   private getDefaultStellarConfig(environment: Environment): StellarConfig {
-    switch (environment) {
-      case 'mainnet':
-        return {
-          networkPassphrase: 'Public Global Stellar Network ; September 2015',
-          horizonUrl: 'https://horizon.stellar.org',
-          sorobanRpcUrl: 'https://soroban-rpc.stellar.org',
-        };
-
-      case 'testnet':
-        return {
-          networkPassphrase: 'Test SDF Network ; September 2015',
-          horizonUrl: 'https://horizon-testnet.stellar.org',
-          sorobanRpcUrl: 'https://soroban-testnet.stellar.org',
-          friendbotUrl: 'https://friendbot.stellar.org',
-        };
-
-      case 'development':
-      default:
-        return {
-          networkPassphrase: 'Test SDF Network ; September 2015',
-          horizonUrl: 'https://horizon-testnet.stellar.org',
-          sorobanRpcUrl: 'https://soroban-testnet.stellar.org',
-          friendbotUrl: 'https://friendbot.stellar.org',
-        };
-    }
+    // Development runs against testnet
+    const { passphrase, ...endpoints } =
+      environment === 'mainnet' ? NETWORKS.mainnet : NETWORKS.testnet;
+
+    return { networkPassphrase: passphrase, ...endpoints };
   }
 
   /**
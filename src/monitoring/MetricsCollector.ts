@@ -59,11 +59,13 @@ export class MetricsCollector {
   record(name: string, value: number, tags?: Record<string, string>): void {
     const key = this.getMetricKey(name, tags);
 
-    if (!this.metrics.has(key)) {
-      this.metrics.set(key, []);
+    let values = this.metrics.get(key);
+    if (!values) {
+      values = [];
+      this.metrics.set(key, values);
     }
 
-    this.metrics.get(key)!.push(value);
+    values.push(value);
 
     // Check threshold and alert if exceeded
     this.checkThreshold(name, value);
@@ -150,8 +152,12 @@ export class MetricsCollector {
       return null;
     }
 
-    const sorted = [...values].sort((a, b) => a - b);
-    const sum = values.reduce((acc, val) => acc + val, 0);
+    // Typed arrays sort numerically without a JS comparator call per pair
+    const sorted = Float64Array.from(values).sort();
+    let sum = 0;
+    for (let i = 0; i < sorted.length; i++) {
+      sum += sorted[i];
+    }
 
     return {
       count: values.length,
@@ -226,7 +232,7 @@ export class MetricsCollector {
   /**
    * Calculate percentile
    */
-  private percentile(sorted: number[], p: number): number {
+  private percentile(sorted: ArrayLike<number>, p: number): number {
     const index = Math.ceil(sorted.length * p) - 1;
     return sorted[Math.max(0, index)];
   }
@@ -4,7 +4,7 @@
  * Exports application metrics in Prometheus format
  */
 
-import { MetricsCollector } from './MetricsCollector';
+import type { MetricsCollector } from './MetricsCollector';
 
 export interface PrometheusMetric {
   name: string;
@@ -16,6 +16,8 @@ export interface PrometheusMetric {
 
 export class PrometheusExporter {
   private metrics: Map<string, PrometheusMetric> = new Map();
+  // Label strings are fixed at registration, so render them once instead of per scrape
+  private renderedLabels: Map<string, string> = new Map();
 
   constructor(private collector: MetricsCollector) {}
 
@@ -25,6 +27,7 @@ export class PrometheusExporter {
   register(metric: PrometheusMetric): void {
     const key = this.getMetricKey(metric.name, metric.labels);
     this.metrics.set(key, metric);
+    this.renderedLabels.set(key, this.formatLabels(metric.labels));
   }
 
   /**
@@ -56,26 +59,27 @@ export class PrometheusExporter {
     const lines: string[] = [];
 
     // Group metrics by name
-    const grouped = new Map<string, PrometheusMetric[]>();
-    this.metrics.forEach(metric => {
-      if (!grouped.has(metric.name)) {
-        grouped.set(metric.name, []);
+    const grouped = new Map<string, Array<[string, PrometheusMetric]>>();
+    this.metrics.forEach((metric, key) => {
+      let group = grouped.get(metric.name);
+      if (!group) {
+        group = [];
+        grouped.set(metric.name, group);
       }
-      grouped.get(metric.name)!.push(metric);
+      group.push([key, metric]);
     });
 
     // Export each metric group
     grouped.forEach((metrics, name) => {
-      const first = metrics[0];
+      const first = metrics[0][1];
 
       // Add HELP and TYPE
       lines.push(`# HELP ${name} ${first.help}`);
       lines.push(`# TYPE ${name} ${first.type}`);
 
       // Add metric values
-      metrics.forEach(metric => {
-        const labels = this.formatLabels(metric.labels);
-        lines.push(`${metric.name}${labels} ${metric.value}`);
+      metrics.forEach(([key, metric]) => {
+        lines.push(`${metric.name}${this.renderedLabels.get(key)} ${metric.value}`);
       });
 
       lines.push(''); // Empty line between metrics
@@ -7,12 +7,68 @@
 import * as http from 'http';
 import { PrometheusExporter } from './monitoring/PrometheusExporter.js';
 import { MetricsCollector } from './monitoring/MetricsCollector.js';
+import { getConnectionPoolStats } from './stellar/httpAgent.js';
+import type { StellarClient } from './stellar/StellarClient.js';
+import { TTLCache } from './utils/TTLCache.js';
 
 export interface ServerConfig {
   port: number;
   host: string;
+  keepAliveTimeout?: number;
+  headersTimeout?: number;
 }
 
+/**
+ * Idle keep-alive window. Kept above the 60s idle timeout used by common
+ * load balancers so they never reuse a socket the server already closed.
+ */
+const DEFAULT_KEEP_ALIVE_TIMEOUT = 65_000;
+
+/**
+ * How long an upstream health result is reused, so frequent probes
+ * cost at most one Horizon call per window
+ */
+const UPSTREAM_HEALTH_TTL = 5_000;
+
+/**
+ * How long an upstream failure is reused; shorter than the healthy window
+ * so recovery shows up quickly without probing a down node on every request
+ */
+const UPSTREAM_FAILURE_TTL = 2_000;
+
+/**
+ * Static service descriptor served from the root endpoint, serialized once
+ */
+const ROOT_BODY = Buffer.from(JSON.stringify({
+  name: 'Project Cygnus',
+  version: '0.7.0',
+  description: 'Machine Economy Stack - Autonomous Agentic Ecosystem',
+  endpoints: {
+    health: '/health',
+    stellarHealth: '/health/stellar',
+    metrics: '/metrics',
+    status: '/status',
+  },
+}));
+
+const NOT_FOUND_BODY = Buffer.from(JSON.stringify({ error: 'Not found' }));
+
+/**
+ * CORS policy as a fixed header block; explicit lists let browsers cache
+ * the preflight result instead of re-asking on every request
+ */
+const CORS_HEADERS: http.OutgoingHttpHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+  'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Payment-Proof, X-Request-Id',
+};
+
+const PREFLIGHT_HEADERS: http.OutgoingHttpHeaders = {
+  ...CORS_HEADERS,
+  'Access-Control-Max-Age': '600',
+  'Content-Length': '0',
+};
+
 /**
  * HTTP Server for Project Cygnus
  */
@@ -21,9 +77,13 @@ export class CygnusServer {
   private config: ServerConfig;
   private metricsCollector: MetricsCollector;
   private prometheusExporter: PrometheusExporter;
+  private stellarClient?: StellarClient;
+  private upstreamHealth = new TTLCache<string, Record<string, unknown>>(UPSTREAM_HEALTH_TTL, 1);
+  private upstreamFailure = new TTLCache<string, string>(UPSTREAM_FAILURE_TTL, 1);
 
-  constructor(config: ServerConfig) {
+  constructor(config: ServerConfig, stellarClient?: StellarClient) {
     this.config = config;
+    this.stellarClient = stellarClient;
     this.metricsCollector = new MetricsCollector();
     this.prometheusExporter = new PrometheusExporter(this.metricsCollector);
   }
@@ -33,10 +93,18 @@ export class CygnusServer {
    */
   async start(): Promise<void> {
     return new Promise((resolve, reject) => {
-      this.server = http.createServer((req, res) => {
+      // Node already parses HTTP natively (llhttp) on the libuv event loop;
+      // the remaining per-request cost is connection setup, so keep sockets
+      // alive and disable Nagle for small JSON responses.
+      this.server = http.createServer({ keepAlive: true, noDelay: true }, (req, res) => {
         this.handleRequest(req, res);
       });
 
+      const keepAliveTimeout = this.config.keepAliveTimeout ?? DEFAULT_KEEP_ALIVE_TIMEOUT;
+      this.server.keepAliveTimeout = keepAliveTimeout;
+      // headersTimeout must exceed keepAliveTimeout or idle sockets are reaped early
+      this.server.headersTimeout = this.config.headersTimeout ?? keepAliveTimeout + 1_000;
+
       this.server.on('error', (error) => {
         console.error('[Server] Error:', error);
         reject(error);
@@ -74,22 +142,24 @@ export class CygnusServer {
    * Handle HTTP requests
    */
   private handleRequest(req: http.IncomingMessage, res: http.ServerResponse): void {
-    const url = req.url || '/';
-
-    // CORS headers
-    res.setHeader('Access-Control-Allow-Origin', '*');
-    res.setHeader('Access-Control-Allow-Methods', 'GET, POST, OPTIONS');
-    res.setHeader('Access-Control-Allow-Headers', 'Content-Type');
+    const [url, query = ''] = (req.url || '/').split('?', 2);
 
     if (req.method === 'OPTIONS') {
-      res.writeHead(200);
+      res.writeHead(204, PREFLIGHT_HEADERS);
       res.end();
       return;
     }
 
+    // CORS headers
+    for (const name in CORS_HEADERS) {
+      res.setHeader(name, CORS_HEADERS[name]!);
+    }
+
     // Route handling
     if (url === '/health') {
       this.handleHealth(req, res);
+    } else if (url === '/health/stellar') {
+      void this.handleStellarHealth(req, res, new URLSearchParams(query).has('refresh'));
     } else if (url === '/metrics') {
       this.handleMetrics(req, res);
     } else if (url === '/status') {
@@ -97,8 +167,7 @@ export class CygnusServer {
     } else if (url === '/') {
       this.handleRoot(req, res);
     } else {
-      res.writeHead(404, { 'Content-Type': 'application/json' });
-      res.end(JSON.stringify({ error: 'Not found' }));
+      this.sendJson(res, 404, NOT_FOUND_BODY);
     }
   }
 
@@ -106,12 +175,49 @@ export class CygnusServer {
    * Health check endpoint
    */
   private handleHealth(_req: http.IncomingMessage, res: http.ServerResponse): void {
-    res.writeHead(200, { 'Content-Type': 'application/json' });
-    res.end(JSON.stringify({
+    this.sendJson(res, 200, {
       status: 'healthy',
       timestamp: new Date().toISOString(),
       uptime: process.uptime(),
-    }));
+    });
+  }
+
+  /**
+   * Stellar upstream health endpoint (uses the shared long-lived client).
+   * Results are cached; `?refresh` bypasses the cache.
+   */
+  private async handleStellarHealth(
+    _req: http.IncomingMessage,
+    res: http.ServerResponse,
+    refresh: boolean = false
+  ): Promise<void> {
+    if (!this.stellarClient) {
+      this.sendJson(res, 503, { status: 'unavailable', error: 'Stellar client not configured' });
+      return;
+    }
+
+    if (refresh) {
+      this.upstreamHealth.delete('stellar');
+      this.upstreamFailure.delete('stellar');
+    }
+
+    const failure = this.upstreamFailure.get('stellar');
+    if (failure !== undefined) {
+      this.sendJson(res, 503, { status: 'unhealthy', error: failure });
+      return;
+    }
+
+    const stellarClient = this.stellarClient;
+    try {
+      const status = await this.upstreamHealth.getOrLoad('stellar', () =>
+        stellarClient.getNetworkStatus()
+      );
+      this.sendJson(res, 200, { status: 'healthy', ...status });
+    } catch (error: any) {
+      const message = error.message || 'Horizon unreachable';
+      this.upstreamFailure.set('stellar', message);
+      this.sendJson(res, 503, { status: 'unhealthy', error: message });
+    }
   }
 
   /**
@@ -126,32 +232,35 @@ export class CygnusServer {
    * Status endpoint
    */
   private handleStatus(_req: http.IncomingMessage, res: http.ServerResponse): void {
-    res.writeHead(200, { 'Content-Type': 'application/json' });
-    res.end(JSON.stringify({
+    this.sendJson(res, 200, {
       name: 'Project Cygnus',
       version: '0.7.0',
       status: 'running',
       uptime: process.uptime(),
       memory: process.memoryUsage(),
+      connectionPool: getConnectionPoolStats(),
       timestamp: new Date().toISOString(),
-    }));
+    });
   }
 
   /**
    * Root endpoint
    */
   private handleRoot(_req: http.IncomingMessage, res: http.ServerResponse): void {
-    res.writeHead(200, { 'Content-Type': 'application/json' });
-    res.end(JSON.stringify({
-      name: 'Project Cygnus',
-      version: '0.7.0',
-      description: 'Machine Economy Stack - Autonomous Agentic Ecosystem',
-      endpoints: {
-        health: '/health',
-        metrics: '/metrics',
-        status: '/status',
-      },
-    }));
+    this.sendJson(res, 200, ROOT_BODY);
+  }
+
+  /**
+   * Send a JSON response with an explicit Content-Length in a single write.
+   * Buffers are treated as already-serialized JSON.
+   */
+  private sendJson(res: http.ServerResponse, statusCode: number, body: unknown): void {
+    const payload = Buffer.isBuffer(body) ? body : Buffer.from(JSON.stringify(body));
+    res.writeHead(statusCode, {
+      'Content-Type': 'application/json',
+      'Content-Length': payload.length,
+    });
+    res.end(payload);
   }
 
   /**
@@ -48,11 +48,13 @@ export class PolicySigner {
   private policies: Map<PolicyId, TransactionPolicy> = new Map();
   private secretKey: string;
   private publicKey: string;
+  // Derived once; seed expansion is too costly to repeat per signature
+  private keypair: StellarSdk.Keypair;
 
   constructor(secretKey: string) {
     this.secretKey = secretKey;
-    const keypair = StellarSdk.Keypair.fromSecret(secretKey);
-    this.publicKey = keypair.publicKey();
+    this.keypair = StellarSdk.Keypair.fromSecret(secretKey);
+    this.publicKey = this.keypair.publicKey();
   }
 
   /**
@@ -149,13 +151,11 @@ export class PolicySigner {
       return null;
     }
 
-    // Sign transaction
-    const keypair = StellarSdk.Keypair.fromSecret(this.secretKey);
-
     // Convert to Stellar SDK format and sign
     // This is simplified - in production would use proper XDR encoding
-    const signature = keypair.sign(Buffer.from(JSON.stringify(tx))).toString('base64');
-    const hash = Buffer.from(JSON.stringify(tx)).toString('hex');
+    const payload = Buffer.from(JSON.stringify(tx));
+    const signature = this.keypair.sign(payload).toString('base64');
+    const hash = payload.toString('hex');
 
     return {
       transaction: tx,
@@ -173,14 +173,15 @@ export class PolicySigner {
     }
 
     // Verify new key is valid
+    let keypair: StellarSdk.Keypair;
     try {
-      StellarSdk.Keypair.fromSecret(newKey);
+      keypair = StellarSdk.Keypair.fromSecret(newKey);
     } catch (error) {
       throw new Error('Invalid new key');
     }
 
     this.secretKey = newKey;
-    const keypair = StellarSdk.Keypair.fromSecret(newKey);
+    this.keypair = keypair;
     this.publicKey = keypair.publicKey();
 
     console.log('Key rotated successfully');
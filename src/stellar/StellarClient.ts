@@ -8,6 +8,165 @@
 import * as StellarSdk from '@stellar/stellar-sdk';
 import { Transaction, SignedTransaction, TxResult, TxParams } from '../types/index.js';
 import { encodeTransaction, decodeTransactionFromXDR } from './xdr/index.js';
+import { keepAliveHttpAgent, keepAliveHttpsAgent } from './httpAgent.js';
+import { TTLCache } from '../utils/TTLCache.js';
+import { NETWORKS } from './network.js';
+
+// Route all Horizon and Soroban RPC requests through the shared keep-alive pool
+for (const client of [StellarSdk.Horizon.AxiosClient, StellarSdk.SorobanRpc.AxiosClient]) {
+  client.defaults.httpAgent = keepAliveHttpAgent;
+  client.defaults.httpsAgent = keepAliveHttpsAgent;
+}
+
+/**
+ * How long the latest-ledger lookup is reused; roughly one ledger close
+ */
+const LATEST_LEDGER_TTL = 2_000;
+
+/**
+ * How long an account's native balance is reused between writes. Payments
+ * from this client invalidate the affected accounts immediately.
+ */
+const BALANCE_TTL = 5_000;
+
+/**
+ * Status lookups kept in flight at once by getTransactionStatuses; stays
+ * under the per-host socket pool so other traffic is not starved
+ */
+const STATUS_LOOKUP_CONCURRENCY = 16;
+
+/**
+ * Settled transaction results kept per client. A transaction that made it
+ * into a ledger never changes, whether it succeeded or failed, so repeated
+ * status checks for it (confirmation polls, proof verification) are answered
+ * locally. Misses and lookup errors are never cached.
+ */
+const SETTLED_TX_TTL = 60 * 60 * 1000;
+const SETTLED_TX_CACHE_SIZE = 1000;
+
+/**
+ * How long a fetched base fee is reused. The fee can only change on ledger
+ * close (~5s), so one lookup serves every transaction built in between.
+ */
+const BASE_FEE_TTL = 4_000;
+
+/**
+ * Submission retries for transient Horizon failures (5xx or no response).
+ * The same signed bytes are re-posted, so a retry never re-signs.
+ */
+const SUBMIT_ATTEMPTS = 3;
+const SUBMIT_RETRY_DELAY = 500;
+
+/**
+ * Shared native asset; SDK assets are immutable
+ */
+const NATIVE_ASSET = StellarSdk.Asset.native();
+
+/**
+ * Stellar's per-transaction operation limit
+ */
+const MAX_OPERATIONS_PER_TX = 100;
+
+/**
+ * Horizon servers shared by every client pointed at the same URL
+ */
+const horizonServers: Map<string, StellarSdk.Horizon.Server> = new Map();
+
+/**
+ * Get the shared Horizon server for a URL, creating it on first use
+ */
+export function getHorizonServer(horizonUrl: string): StellarSdk.Horizon.Server {
+  let server = horizonServers.get(horizonUrl);
+  if (!server) {
+    server = new StellarSdk.Horizon.Server(horizonUrl);
+    horizonServers.set(horizonUrl, server);
+  }
+  return server;
+}
+
+/**
+ * Base fees per shared Horizon server (and so per URL)
+ */
+const baseFees = new TTLCache<StellarSdk.Horizon.Server, number>(BASE_FEE_TTL, 16);
+
+/**
+ * Keypairs derived from secrets, most recently used last. Derivation
+ * (StrKey checksum + ed25519 seed expansion) is repeated CPU work for every
+ * send from the same account. This keeps up to KEYPAIR_CACHE_SIZE secrets
+ * resident in process memory, which the client already holds while signing.
+ */
+const KEYPAIR_CACHE_SIZE = 64;
+const keypairs: Map<string, StellarSdk.Keypair> = new Map();
+
+/**
+ * Get the keypair for a secret, deriving it on first use
+ */
+function keypairFromSecret(secret: string): StellarSdk.Keypair {
+  let keypair = keypairs.get(secret);
+  if (keypair) {
+    keypairs.delete(secret);
+  } else {
+    keypair = StellarSdk.Keypair.fromSecret(secret);
+    if (keypairs.size >= KEYPAIR_CACHE_SIZE) {
+      keypairs.delete(keypairs.keys().next().value!);
+    }
+  }
+  keypairs.set(secret, keypair);
+  return keypair;
+}
+
+/**
+ * Built payment operations keyed by destination, amount and asset.
+ * Recurring payments with the same terms reuse one encoded operation; only
+ * the envelope (sequence number, fee, signature) is rebuilt per send.
+ */
+const PAYMENT_OP_CACHE_SIZE = 256;
+const paymentOps: Map<string, StellarSdk.xdr.Operation> = new Map();
+
+/**
+ * Text memos keyed by content. Scheduled payments (loan repayments, refunds)
+ * repeat the same memo every run, so its validation and encoding are done once.
+ */
+const MEMO_CACHE_SIZE = 256;
+const textMemos: Map<string, StellarSdk.Memo> = new Map();
+
+/**
+ * Normalize a Horizon submit response or transaction record into a TxResult.
+ * Submit responses carry the ledger as `ledger`; transaction records carry it
+ * as `ledger_attr` (their `ledger` is a link to the ledger resource).
+ */
+function toTxResult(response: {
+  successful: boolean;
+  hash: string;
+  ledger?: unknown;
+  ledger_attr?: number;
+  source_account?: string;
+}): TxResult {
+  const ledger = response.ledger_attr ?? response.ledger;
+
+  return {
+    success: response.successful,
+    hash: response.hash,
+    ledger: typeof ledger === 'number' ? ledger : typeof ledger === 'string' ? parseInt(ledger, 10) : undefined,
+    sourceAccount: response.source_account,
+  };
+}
+
+/**
+ * Whether a rejected submission may still have changed balances. Horizon
+ * reports applied-but-failed transactions as 400 tx_failed, which still
+ * charge the fee; with no response or a 5xx the outcome is unknown.
+ */
+function mayHaveApplied(error: any): boolean {
+  const status = error?.response?.status;
+  const code = error?.response?.data?.extras?.result_codes?.transaction;
+  return (
+    status === undefined ||
+    status >= 500 ||
+    code === 'tx_failed' ||
+    code === 'tx_fee_bump_inner_failed'
+  );
+}
 
 /**
  * Stellar client configuration
@@ -16,6 +175,8 @@ export interface StellarClientConfig {
   network: 'testnet' | 'mainnet';
   horizonUrl?: string;
   rpcUrl?: string;
+  /** Open a pooled Horizon connection at construction, off the critical path */
+  warmup?: boolean;
 }
 
 /**
@@ -25,34 +186,49 @@ export class StellarClient {
   private server: StellarSdk.Horizon.Server;
   private networkPassphrase: string;
   private network: 'testnet' | 'mainnet';
+  private friendbotUrl?: string;
+  private latestLedger = new TTLCache<string, { sequence: number; closedAt: string }>(
+    LATEST_LEDGER_TTL,
+    1
+  );
+  private balances = new TTLCache<string, number>(BALANCE_TTL, 1000);
+  private settledTxs = new TTLCache<string, TxResult>(SETTLED_TX_TTL, SETTLED_TX_CACHE_SIZE);
+  // Status lookups in flight, shared by concurrent callers for the same hash
+  private statusLookups = new Map<string, Promise<TxResult>>();
 
   constructor(config: StellarClientConfig) {
     this.network = config.network;
+    const settings = NETWORKS[config.network];
 
     // Set network passphrase
-    this.networkPassphrase =
-      config.network === 'testnet' ? StellarSdk.Networks.TESTNET : StellarSdk.Networks.PUBLIC;
+    this.networkPassphrase = settings.passphrase;
+    this.friendbotUrl = settings.friendbotUrl;
 
     // Initialize Horizon server
-    const horizonUrl =
-      config.horizonUrl ||
-      (config.network === 'testnet'
-        ? 'https://horizon-testnet.stellar.org'
-        : 'https://horizon.stellar.org');
-
-    this.server = new StellarSdk.Horizon.Server(horizonUrl);
+    this.server = getHorizonServer(config.horizonUrl || settings.horizonUrl);
+
+    // A cheap background read leaves a warm keep-alive socket in the pool,
+    // so the first user-visible call skips the TCP + TLS handshake
+    if (config.warmup) {
+      this.getLatestLedger().catch((error) => {
+        console.warn('[StellarClient] Warmup failed:', error.message || error);
+      });
+    }
   }
 
   /**
    * Construct a transaction
    */
   async constructTransaction(sourceAccount: string, params: TxParams): Promise<Transaction> {
-    // Load account to get sequence number
-    const account = await this.server.loadAccount(sourceAccount);
+    // Sequence number and network fee are independent lookups; fetch together
+    const [account, baseFee] = await Promise.all([
+      this.server.loadAccount(sourceAccount),
+      baseFees.getOrLoad(this.server, () => this.server.fetchBaseFee()),
+    ]);
 
     // Create transaction builder
     const txBuilder = new StellarSdk.TransactionBuilder(account, {
-      fee: StellarSdk.BASE_FEE,
+      fee: String(Math.max(baseFee, Number(StellarSdk.BASE_FEE))),
       networkPassphrase: this.networkPassphrase,
     });
 
@@ -63,14 +239,7 @@ export class StellarClient {
           throw new Error('Payment requires destination, amount, and asset');
         }
         txBuilder.addOperation(
-          StellarSdk.Operation.payment({
-            destination: params.destination,
-            asset:
-              params.asset === 'XLM'
-                ? StellarSdk.Asset.native()
-                : new StellarSdk.Asset(params.asset, params.destination),
-            amount: params.amount.toString(),
-          })
+          this.paymentOperation(params.destination, params.amount, params.asset)
         );
         break;
 
@@ -101,7 +270,7 @@ export class StellarClient {
 
     // Add memo if provided
     if (params.memo) {
-      txBuilder.addMemo(StellarSdk.Memo.text(params.memo));
+      txBuilder.addMemo(this.textMemo(params.memo));
     }
 
     // Set timeout
@@ -120,7 +289,7 @@ export class StellarClient {
    */
   async signTransaction(tx: Transaction, secretKey: string): Promise<SignedTransaction> {
     // Convert to Stellar SDK transaction
-    const keypair = StellarSdk.Keypair.fromSecret(secretKey);
+    const keypair = keypairFromSecret(secretKey);
 
     // Encode transaction to XDR
     const xdr = encodeTransaction(tx);
@@ -143,6 +312,7 @@ export class StellarClient {
       transaction: tx,
       signature,
       hash,
+      envelopeXdr: stellarTx.toXDR(),
     };
   }
 
@@ -151,20 +321,28 @@ export class StellarClient {
    */
   async broadcastTransaction(signedTx: SignedTransaction): Promise<TxResult> {
     try {
-      // Encode signed transaction
-      const xdr = encodeTransaction(signedTx.transaction);
-
-      // Load and sign transaction
+      // Prefer the signed envelope; re-encoding the transaction drops signatures
+      const xdr = signedTx.envelopeXdr ?? encodeTransaction(signedTx.transaction);
       const stellarTx = StellarSdk.TransactionBuilder.fromXDR(xdr, this.networkPassphrase);
 
-      // Submit to network
-      const response = await this.server.submitTransaction(stellarTx as any);
-
-      return {
-        success: response.successful,
-        hash: response.hash,
-        ledger: typeof response.ledger === 'string' ? parseInt(response.ledger) : response.ledger,
-      };
+      // Submit to network, re-posting the same bytes on transient failures
+      for (let attempt = 1; ; attempt++) {
+        try {
+          const response = await this.server.submitTransaction(stellarTx as any);
+          this.invalidateBalances(stellarTx);
+          return toTxResult(response);
+        } catch (error: any) {
+          if (mayHaveApplied(error)) {
+            this.invalidateBalances(stellarTx);
+          }
+          const status = error.response?.status;
+          const transient = status === undefined || status >= 500;
+          if (!transient || attempt >= SUBMIT_ATTEMPTS) {
+            throw error;
+          }
+          await new Promise((resolve) => setTimeout(resolve, SUBMIT_RETRY_DELAY * 2 ** (attempt - 1)));
+        }
+      }
     } catch (error: any) {
       return {
         success: false,
@@ -178,21 +356,84 @@ export class StellarClient {
    * Get transaction status
    */
   async getTransactionStatus(hash: string): Promise<TxResult> {
-    try {
-      const response = await this.server.transactions().transaction(hash).call();
+    const settled = this.settledTxs.get(hash);
+    if (settled) {
+      return settled;
+    }
 
-      return {
-        success: response.successful,
-        hash: response.hash,
-        ledger: typeof response.ledger === 'string' ? parseInt(response.ledger) : response.ledger,
-      };
-    } catch (error: any) {
-      return {
-        success: false,
-        hash,
-        error: error.message || 'Transaction not found',
-      };
+    let lookup = this.statusLookups.get(hash);
+    if (!lookup) {
+      lookup = this.fetchTransactionStatus(hash).finally(() => this.statusLookups.delete(hash));
+      this.statusLookups.set(hash, lookup);
     }
+    return lookup;
+  }
+
+  /**
+   * Get the status of many transactions, with up to
+   * STATUS_LOOKUP_CONCURRENCY lookups in flight so N hashes cost roughly
+   * N / STATUS_LOOKUP_CONCURRENCY round trips instead of N
+   */
+  async getTransactionStatuses(hashes: string[]): Promise<Map<string, TxResult>> {
+    const results = new Map<string, TxResult>();
+    const pending = [...new Set(hashes)];
+    let next = 0;
+
+    const worker = async (): Promise<void> => {
+      while (next < pending.length) {
+        const hash = pending[next++];
+        results.set(hash, await this.getTransactionStatus(hash));
+      }
+    };
+
+    const workers = Math.min(STATUS_LOOKUP_CONCURRENCY, pending.length);
+    await Promise.all(Array.from({ length: workers }, worker));
+    return results;
+  }
+
+  /**
+   * Wait for a transaction by streaming the source account's transactions
+   * from Horizon (SSE) instead of polling. Resolves with the result as soon
+   * as it lands, or null if the stream fails or times out so callers can
+   * fall back to polling.
+   */
+  waitForTransaction(hash: string, sourceAccount: string, timeoutMs: number): Promise<TxResult | null> {
+    return new Promise((resolve) => {
+      let settled = false;
+      let closeStream: (() => void) | undefined;
+
+      const finish = (result: TxResult | null) => {
+        if (settled) {
+          return;
+        }
+        settled = true;
+        clearTimeout(timer);
+        closeStream?.();
+        resolve(result);
+      };
+
+      const timer = setTimeout(() => finish(null), timeoutMs);
+
+      closeStream = this.server
+        .transactions()
+        .forAccount(sourceAccount)
+        .cursor('now')
+        .stream({
+          onmessage: (record: any) => {
+            if (record.hash === hash) {
+              finish(toTxResult(record));
+            }
+          },
+          onerror: () => finish(null),
+        });
+
+      // The transaction may have landed before the stream opened
+      this.getTransactionStatus(hash).then((status) => {
+        if (status.success || !status.error) {
+          finish(status);
+        }
+      });
+    });
   }
 
   /**
@@ -200,14 +441,24 @@ export class StellarClient {
    */
   async getBalance(publicKey: string): Promise<number> {
     try {
-      const account = await this.server.loadAccount(publicKey);
-      const nativeBalance = account.balances.find((b: any) => b.asset_type === 'native');
-      return nativeBalance ? parseFloat(nativeBalance.balance) : 0;
+      return await this.balances.getOrLoad(publicKey, async () => {
+        const account = await this.server.loadAccount(publicKey);
+        const nativeBalance = account.balances.find((b: any) => b.asset_type === 'native');
+        return nativeBalance ? parseFloat(nativeBalance.balance) : 0;
+      });
     } catch (error) {
       throw new Error(`Failed to get balance: ${error}`);
     }
   }
 
+  /**
+   * Drop an account's cached balance so the next read goes to Horizon. A
+   * read already in flight is not cached once it completes.
+   */
+  invalidateBalance(publicKey: string): void {
+    this.balances.delete(publicKey);
+  }
+
   /**
    * Get account details
    */
@@ -223,12 +474,12 @@ export class StellarClient {
    * Fund account (testnet only)
    */
   async fundAccount(publicKey: string): Promise<void> {
-    if (this.network !== 'testnet') {
+    if (!this.friendbotUrl) {
       throw new Error('Account funding only available on testnet');
     }
 
     try {
-      await fetch(`https://friendbot.stellar.org?addr=${publicKey}`);
+      await fetch(`${this.friendbotUrl}?addr=${encodeURIComponent(publicKey)}`);
     } catch (error) {
       throw new Error(`Failed to fund account: ${error}`);
     }
@@ -264,6 +515,141 @@ export class StellarClient {
     };
   }
 
+  /**
+   * Get upstream network status from the latest closed ledger
+   */
+  async getNetworkStatus(): Promise<{ network: string; latestLedger: number; closedAt: string }> {
+    const ledger = await this.getLatestLedger();
+
+    return {
+      network: this.network,
+      latestLedger: ledger.sequence,
+      closedAt: ledger.closedAt,
+    };
+  }
+
+  /**
+   * Get the latest closed ledger, reused for one ledger close interval
+   */
+  async getLatestLedger(): Promise<{ sequence: number; closedAt: string }> {
+    return this.latestLedger.getOrLoad('latest', async () => {
+      const page = await this.server.ledgers().order('desc').limit(1).call();
+      const ledger = page.records[0];
+      return { sequence: ledger.sequence, closedAt: ledger.closed_at };
+    });
+  }
+
+  /**
+   * Drop cached network state so the next read goes to Horizon
+   */
+  invalidateCache(): void {
+    this.latestLedger.clear();
+    this.balances.clear();
+  }
+
+  /**
+   * Send many payments from one account. The account and base fee are
+   * loaded once and payments are packed up to 100 per transaction, so N
+   * payments cost ceil(N / 100) submissions instead of N full round trips.
+   * Transactions are submitted in sequence order and sending stops at the
+   * first failure, since later sequence numbers would no longer be valid.
+   */
+  async sendPayments(
+    sourceSecret: string,
+    payments: Array<{ destination: string; amount: number; asset?: string }>,
+    memo?: string
+  ): Promise<TxResult[]> {
+    const sourceKeypair = keypairFromSecret(sourceSecret);
+    const [account, baseFee] = await Promise.all([
+      this.server.loadAccount(sourceKeypair.publicKey()),
+      baseFees.getOrLoad(this.server, () => this.server.fetchBaseFee()),
+    ]);
+    const fee = String(Math.max(baseFee, Number(StellarSdk.BASE_FEE)));
+
+    const results: TxResult[] = [];
+    for (let start = 0; start < payments.length; start += MAX_OPERATIONS_PER_TX) {
+      // The builder advances the loaded account's sequence number on build()
+      const txBuilder = new StellarSdk.TransactionBuilder(account, {
+        fee,
+        networkPassphrase: this.networkPassphrase,
+      });
+
+      for (const payment of payments.slice(start, start + MAX_OPERATIONS_PER_TX)) {
+        txBuilder.addOperation(
+          this.paymentOperation(payment.destination, payment.amount, payment.asset ?? 'XLM')
+        );
+      }
+
+      if (memo) {
+        txBuilder.addMemo(this.textMemo(memo));
+      }
+
+      const stellarTx = txBuilder.setTimeout(30).build();
+      stellarTx.sign(sourceKeypair);
+
+      let result: TxResult;
+      try {
+        result = toTxResult(await this.server.submitTransaction(stellarTx));
+        this.invalidateBalances(stellarTx);
+      } catch (error: any) {
+        if (mayHaveApplied(error)) {
+          this.invalidateBalances(stellarTx);
+        }
+        result = {
+          success: false,
+          hash: stellarTx.hash().toString('hex'),
+          error: error.message || 'Transaction failed',
+        };
+      }
+
+      results.push(result);
+      if (!result.success) {
+        break;
+      }
+    }
+
+    return results;
+  }
+
+  /**
+   * Get the payment operation for these terms, building it on first use
+   */
+  private paymentOperation(destination: string, amount: number, asset: string): StellarSdk.xdr.Operation {
+    const key = `${destination}|${amount}|${asset}`;
+    let operation = paymentOps.get(key);
+
+    if (!operation) {
+      operation = StellarSdk.Operation.payment({
+        destination,
+        asset: asset === 'XLM' ? NATIVE_ASSET : new StellarSdk.Asset(asset, destination),
+        amount: amount.toString(),
+      });
+      if (paymentOps.size >= PAYMENT_OP_CACHE_SIZE) {
+        paymentOps.delete(paymentOps.keys().next().value!);
+      }
+      paymentOps.set(key, operation);
+    }
+
+    return operation;
+  }
+
+  /**
+   * Get the text memo for this content, building it on first use
+   */
+  private textMemo(text: string): StellarSdk.Memo {
+    let memo = textMemos.get(text);
+
+    if (!memo) {
+      memo = StellarSdk.Memo.text(text);
+      if (textMemos.size >= MEMO_CACHE_SIZE) {
+        textMemos.delete(textMemos.keys().next().value!);
+      }
+      textMemos.set(text, memo);
+    }
+
+    return memo;
+  }
+
   /**
    * Send payment (convenience method)
    */
@@ -275,7 +661,7 @@ export class StellarClient {
     memo?: string
   ): Promise<TxResult> {
     // Get source public key
-    const sourceKeypair = StellarSdk.Keypair.fromSecret(sourceSecret);
+    const sourceKeypair = keypairFromSecret(sourceSecret);
     const sourcePublic = sourceKeypair.publicKey();
 
     // Construct payment transaction
@@ -293,4 +679,41 @@ export class StellarClient {
     // Broadcast transaction
     return await this.broadcastTransaction(signedTx);
   }
+
+  // Private methods
+
+  /**
+   * Fetch a transaction's status from Horizon, caching it once settled
+   */
+  private async fetchTransactionStatus(hash: string): Promise<TxResult> {
+    try {
+      const response = await this.server.transactions().transaction(hash).call();
+
+      // Only cache once the transaction is in a ledger; misses may still land
+      const result = toTxResult(response);
+      if (result.ledger !== undefined) {
+        this.settledTxs.set(hash, result);
+      }
+      return result;
+    } catch (error: any) {
+      return {
+        success: false,
+        hash,
+        error: error.message || 'Transaction not found',
+      };
+    }
+  }
+
+  /**
+   * Invalidate the cached balances a transaction can change: its source
+   * and every operation source or destination
+   */
+  private invalidateBalances(tx: any): void {
+    const inner = tx.innerTransaction ?? tx;
+    this.balances.delete(inner.source);
+    for (const op of inner.operations) {
+      if (op.source) this.balances.delete(op.source);
+      if (op.destination) this.balances.delete(op.destination);
+    }
+  }
 }
@@ -0,0 +1,71 @@
+/**
+ * Shared HTTP Connection Pool
+ *
+ * Keep-alive agents reused by every outbound Horizon and Soroban RPC
+ * request so each call does not pay a fresh TCP + TLS handshake.
+ */
+
+import * as http from 'http';
+import * as https from 'https';
+
+/**
+ * Connection pool statistics
+ */
+export interface ConnectionPoolStats {
+  active: number;
+  idle: number;
+  queued: number;
+}
+
+/**
+ * Read a positive integer pool setting from the environment
+ */
+function poolSetting(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isInteger(value) && value > 0 ? value : fallback;
+}
+
+const POOL_OPTIONS: https.AgentOptions = {
+  keepAlive: true,
+  keepAliveMsecs: 30_000,
+  // Sized for concurrent submit + confirmation-poll traffic to one host;
+  // override per deployment for burstier or quieter workloads
+  maxSockets: poolSetting('CYGNUS_HTTP_MAX_SOCKETS', 32),
+  maxFreeSockets: poolSetting('CYGNUS_HTTP_MAX_FREE_SOCKETS', 16),
+  // Cap across all hosts (Horizon and Soroban RPC) so a burst against one
+  // cannot exhaust file descriptors for the process
+  maxTotalSockets: poolSetting('CYGNUS_HTTP_MAX_TOTAL_SOCKETS', 64),
+  // Idle sockets are dropped after a minute so stale connections are not reused
+  timeout: poolSetting('CYGNUS_HTTP_IDLE_TIMEOUT_MS', 60_000),
+  // Reuse the most recently used socket; cold sockets age out instead of churning
+  scheduling: 'lifo',
+};
+
+export const keepAliveHttpAgent = new http.Agent(POOL_OPTIONS);
+export const keepAliveHttpsAgent = new https.Agent(POOL_OPTIONS);
+
+/**
+ * Count sockets across all origins of an agent pool
+ */
+function countSockets(pool: NodeJS.ReadOnlyDict<unknown[]>): number {
+  let total = 0;
+  for (const key in pool) {
+    total += pool[key]?.length ?? 0;
+  }
+  return total;
+}
+
+/**
+ * Get statistics for the shared connection pool
+ */
+export function getConnectionPoolStats(): ConnectionPoolStats {
+  const stats: ConnectionPoolStats = { active: 0, idle: 0, queued: 0 };
+
+  for (const agent of [keepAliveHttpAgent, keepAliveHttpsAgent]) {
+    stats.active += countSockets(agent.sockets);
+    stats.idle += countSockets(agent.freeSockets);
+    stats.queued += countSockets(agent.requests);
+  }
+
+  return stats;
+}
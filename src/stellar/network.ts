@@ -0,0 +1,29 @@
+/**
+ * Stellar Network Constants
+ *
+ * Passphrases and endpoints per network, resolved once at module load and
+ * shared by the client and configuration defaults.
+ */
+
+export type StellarNetwork = 'testnet' | 'mainnet';
+
+export interface NetworkSettings {
+  passphrase: string;
+  horizonUrl: string;
+  sorobanRpcUrl: string;
+  friendbotUrl?: string;
+}
+
+export const NETWORKS: Readonly<Record<StellarNetwork, Readonly<NetworkSettings>>> = Object.freeze({
+  testnet: Object.freeze({
+    passphrase: 'Test SDF Network ; September 2015',
+    horizonUrl: 'https://horizon-testnet.stellar.org',
+    sorobanRpcUrl: 'https://soroban-testnet.stellar.org',
+    friendbotUrl: 'https://friendbot.stellar.org',
+  }),
+  mainnet: Object.freeze({
+    passphrase: 'Public Global Stellar Network ; September 2015',
+    horizonUrl: 'https://horizon.stellar.org',
+    sorobanRpcUrl: 'https://soroban-rpc.stellar.org',
+  }),
+});
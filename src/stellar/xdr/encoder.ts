@@ -15,6 +15,12 @@ import {
   AssetType,
 } from './types.js';
 
+/**
+ * Shared native asset; SDK assets are immutable, so one instance serves
+ * every encode
+ */
+const NATIVE_ASSET = StellarSdk.Asset.native();
+
 /**
  * Encodes a transaction envelope to XDR format
  */
@@ -107,7 +113,7 @@ function encodeOperation(op: Operation): StellarSdk.Operation {
 function encodeAsset(asset: Asset): StellarSdk.Asset {
   switch (asset.type) {
     case AssetType.ASSET_TYPE_NATIVE:
-      return StellarSdk.Asset.native();
+      return NATIVE_ASSET;
 
     case AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
     case AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
@@ -43,6 +43,7 @@ export interface SignedTransaction {
   transaction: Transaction;
   signature: string;
   hash: string;
+  envelopeXdr?: string; // Signed envelope (base64); resubmitted as-is on retry
 }
 
 /**
@@ -52,6 +53,8 @@ export interface TxResult {
   success: boolean;
   hash: string;
   ledger?: number | string; // Can be number or string depending on Stellar SDK version
+  /** Account that submitted the transaction, when known */
+  sourceAccount?: string;
   error?: string;
 }
 
@@ -254,10 +254,12 @@ export class CircuitBreakerManager {
    * Get or create circuit breaker for service
    */
   getBreaker(serviceName: string, config?: Partial<CircuitBreakerConfig>): CircuitBreaker {
-    if (!this.breakers.has(serviceName)) {
-      this.breakers.set(serviceName, new CircuitBreaker(serviceName, config));
+    let breaker = this.breakers.get(serviceName);
+    if (!breaker) {
+      breaker = new CircuitBreaker(serviceName, config);
+      this.breakers.set(serviceName, breaker);
     }
-    return this.breakers.get(serviceName)!;
+    return breaker;
   }
 
   /**
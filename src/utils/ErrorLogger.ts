@@ -48,6 +48,13 @@ export interface ErrorLoggerConfig {
 export class ErrorLogger {
   private logs: ErrorLog[] = [];
   private logFilePath: string;
+  // Append stream kept open so logging never blocks on a file write
+  private logStream: fs.WriteStream | null = null;
+  // Bytes in the current log file, tracked so rotation needs no stat call
+  private logFileSize: number = 0;
+  // Rotation in progress, and the lines logged meanwhile that wait for it
+  private rotation: Promise<void> | null = null;
+  private pendingLines: string[] = [];
 
   private defaultConfig: ErrorLoggerConfig = {
     logDirectory: './logs',
@@ -69,6 +76,9 @@ export class ErrorLogger {
         fs.mkdirSync(cfg.logDirectory, { recursive: true });
       }
       this.logFilePath = path.join(cfg.logDirectory, 'errors.log');
+      if (fs.existsSync(this.logFilePath)) {
+        this.logFileSize = fs.statSync(this.logFilePath).size;
+      }
     } else {
       this.logFilePath = '';
     }
@@ -266,29 +276,50 @@ export class ErrorLogger {
     const color = severityColors[log.severity];
     const reset = '\x1b[0m';
 
-    console.error(`${color}[${log.severity}]${reset} ${log.errorType}: ${log.errorMessage}`);
-    console.error(`  Operation: ${log.context.operation}`);
+    // One write per error rather than one per line
+    let message = `${color}[${log.severity}]${reset} ${log.errorType}: ${log.errorMessage}`;
+    message += `\n  Operation: ${log.context.operation}`;
     if (log.context.component) {
-      console.error(`  Component: ${log.context.component}`);
+      message += `\n  Component: ${log.context.component}`;
     }
     if (log.context.agentDID) {
-      console.error(`  Agent: ${log.context.agentDID}`);
+      message += `\n  Agent: ${log.context.agentDID}`;
     }
     if (log.context.transactionId) {
-      console.error(`  Transaction: ${log.context.transactionId}`);
+      message += `\n  Transaction: ${log.context.transactionId}`;
     }
+    console.error(message);
   }
 
   /**
    * Log to file
    */
   private logToFile(log: ErrorLog): void {
-    try {
-      const logLine = JSON.stringify(log) + '\n';
-      fs.appendFileSync(this.logFilePath, logLine);
-    } catch (error) {
-      console.error('[ErrorLogger] Failed to write to log file:', error);
+    const logLine = JSON.stringify(log) + '\n';
+
+    // Held back until the rotated file is renamed, so no stream can open a
+    // new errors.log that the rename would then move away
+    if (this.rotation) {
+      this.pendingLines.push(logLine);
+      return;
     }
+
+    this.writeLine(logLine);
+  }
+
+  /**
+   * Append a line to the current log file, opening it on first use
+   */
+  private writeLine(logLine: string): void {
+    if (!this.logStream) {
+      this.logStream = fs.createWriteStream(this.logFilePath, { flags: 'a' });
+      this.logStream.on('error', (error) => {
+        console.error('[ErrorLogger] Failed to write to log file:', error);
+      });
+    }
+
+    this.logStream.write(logLine);
+    this.logFileSize += Buffer.byteLength(logLine);
   }
 
   /**
@@ -337,15 +368,19 @@ export class ErrorLogger {
     const config = this.config as ErrorLoggerConfig;
     const cutoff = Date.now() - config.maxLogAge;
 
-    // Remove old logs from memory
-    this.logs = this.logs.filter(log => log.timestamp >= cutoff);
+    // Remove old logs from memory. Logs are appended in time order, so
+    // expired entries are a prefix; the common case copies nothing.
+    let expired = 0;
+    while (expired < this.logs.length && this.logs[expired].timestamp < cutoff) {
+      expired++;
+    }
+    if (expired > 0) {
+      this.logs.splice(0, expired);
+    }
 
     // Rotate log file if too large
-    if (config.enableFile && fs.existsSync(this.logFilePath)) {
-      const stats = fs.statSync(this.logFilePath);
-      if (stats.size >= config.maxLogSize) {
-        this.rotateLogFile();
-      }
+    if (config.enableFile && !this.rotation && this.logFileSize >= config.maxLogSize) {
+      this.rotateLogFile();
     }
   }
 
@@ -356,12 +391,36 @@ export class ErrorLogger {
     const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
     const archivePath = this.logFilePath.replace('.log', `-${timestamp}.log`);
 
-    try {
-      fs.renameSync(this.logFilePath, archivePath);
-      console.log(`[ErrorLogger] Log file rotated to ${archivePath}`);
-    } catch (error) {
-      console.error('[ErrorLogger] Failed to rotate log file:', error);
-    }
+    // End the current stream first: its finish waits for a lazily opened
+    // file and flushes queued writes, so the rename moves a complete file
+    const stream = this.logStream;
+    this.logStream = null;
+
+    this.rotation = new Promise<void>((resolve) => {
+      const rename = () =>
+        fs.rename(this.logFilePath, archivePath, (error) => {
+          if (error) {
+            console.error('[ErrorLogger] Failed to rotate log file:', error);
+          } else {
+            this.logFileSize = 0;
+            console.log(`[ErrorLogger] Log file rotated to ${archivePath}`);
+          }
+
+          this.rotation = null;
+          const pending = this.pendingLines;
+          this.pendingLines = [];
+          for (const line of pending) {
+            this.writeLine(line);
+          }
+          resolve();
+        });
+
+      if (stream) {
+        stream.end(rename);
+      } else {
+        rename();
+      }
+    });
   }
 
   /**
@@ -378,6 +437,21 @@ export class ErrorLogger {
     this.logs = [];
     console.log('[ErrorLogger] All logs cleared');
   }
+
+  /**
+   * Flush pending file writes and close the log file
+   */
+  async close(): Promise<void> {
+    // Lines held back by a rotation are written once it completes
+    await this.rotation;
+
+    const stream = this.logStream;
+    this.logStream = null;
+
+    if (stream) {
+      await new Promise<void>((resolve) => stream.end(resolve));
+    }
+  }
 }
 
 /**
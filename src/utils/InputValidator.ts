@@ -8,6 +8,15 @@
 import { PaymentProof } from '../../protocols/x402/types.js';
 import { VerifiableCredential, DIDDocument } from '../../protocols/masumi/types.js';
 
+// Patterns compiled once at module load rather than on every call
+const DID_PATTERN = /^did:[a-z0-9]+:[a-zA-Z0-9._-]+$/;
+const STELLAR_ADDRESS_PATTERN = /^G[A-Z2-7]{55}$/;
+const NULL_BYTES = /\0/g;
+
+// Schema constants shared by every validation call
+const PAYMENT_PROOF_TYPES: ReadonlySet<string> = new Set(['on-chain', 'channel']);
+const MAX_PROOF_AGE_MS = 24 * 60 * 60 * 1000;
+
 export class ValidationError extends Error {
   constructor(
     message: string,
@@ -28,7 +37,7 @@ export class InputValidator {
       throw new ValidationError('Payment proof is required');
     }
 
-    if (!proof.type || !['on-chain', 'channel'].includes(proof.type)) {
+    if (!proof.type || !PAYMENT_PROOF_TYPES.has(proof.type)) {
       throw new ValidationError('Invalid payment proof type', 'type', proof.type);
     }
 
@@ -37,11 +46,18 @@ export class InputValidator {
     }
 
     // Validate timestamp is not too old (24 hours)
-    const maxAge = 24 * 60 * 60 * 1000;
-    if (Date.now() - proof.timestamp > maxAge) {
+    if (Date.now() - proof.timestamp > MAX_PROOF_AGE_MS) {
       throw new ValidationError('Payment proof is too old', 'timestamp');
     }
 
+    if (!proof.payer || !this.isValidStellarAddress(proof.payer)) {
+      throw new ValidationError('Invalid payment proof payer', 'payer', proof.payer);
+    }
+
+    if (!proof.signature) {
+      throw new ValidationError('Payment proof signature is required', 'signature');
+    }
+
     if (proof.type === 'on-chain') {
       if (!proof.transactionHash) {
         throw new ValidationError(
@@ -106,8 +122,7 @@ export class InputValidator {
     }
 
     // W3C DID format: did:method:identifier
-    const didRegex = /^did:[a-z0-9]+:[a-zA-Z0-9._-]+$/;
-    if (!didRegex.test(did)) {
+    if (!DID_PATTERN.test(did)) {
       throw new ValidationError('Invalid DID format', 'did', did);
     }
   }
@@ -279,15 +294,28 @@ export class InputValidator {
    */
   private static isValidStellarAddress(address: string): boolean {
     // Stellar addresses are 56 characters, start with G
-    return /^G[A-Z2-7]{55}$/.test(address);
+    return STELLAR_ADDRESS_PATTERN.test(address);
   }
 
   /**
    * Check if valid transaction hash
    */
   private static isValidTransactionHash(hash: string): boolean {
-    // Stellar transaction hashes are 64 character hex strings
-    return /^[a-f0-9]{64}$/i.test(hash);
+    // Stellar transaction hashes are 64 character hex strings; a fixed-length
+    // char-code scan is cheaper than running the regex engine per proof
+    if (hash.length !== 64) {
+      return false;
+    }
+
+    for (let i = 0; i < 64; i++) {
+      const code = hash.charCodeAt(i);
+      const lower = code | 0x20; // fold A-F onto a-f
+      if (!((code >= 0x30 && code <= 0x39) || (lower >= 0x61 && lower <= 0x66))) {
+        return false;
+      }
+    }
+
+    return true;
   }
 
   /**
@@ -307,7 +335,7 @@ export class InputValidator {
     }
 
     // Remove null bytes
-    let sanitized = input.replace(/\0/g, '');
+    let sanitized = input.includes('\0') ? input.replace(NULL_BYTES, '') : input;
 
     // Trim whitespace
     sanitized = sanitized.trim();
@@ -0,0 +1,125 @@
+/**
+ * TTL Cache Implementation
+ *
+ * Small in-process cache with per-entry expiry, bounded size and
+ * coalescing of concurrent loads for the same key.
+ */
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Time-to-live cache
+ *
+ * Expiry uses the monotonic performance clock so wall-clock adjustments
+ * cannot extend or cut short an entry's lifetime.
+ */
+export class TTLCache<K, V> {
+  private entries: Map<K, CacheEntry<V>> = new Map();
+  private inflight: Map<K, Promise<V>> = new Map();
+
+  constructor(
+    private ttlMs: number,
+    private maxSize: number = 1000
+  ) {}
+
+  /**
+   * Get a cached value, or undefined if missing or expired
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (entry.expiresAt <= performance.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    return entry.value;
+  }
+
+  /**
+   * Store a value, evicting the oldest entry when full
+   */
+  set(key: K, value: V, ttlMs: number = this.ttlMs): void {
+    this.entries.delete(key);
+
+    if (this.entries.size >= this.maxSize) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) {
+        this.entries.delete(oldest.value);
+      }
+    }
+
+    this.entries.set(key, { value, expiresAt: performance.now() + ttlMs });
+  }
+
+  /**
+   * Check if a live entry exists
+   */
+  has(key: K): boolean {
+    return this.get(key) !== undefined;
+  }
+
+  /**
+   * Remove an entry and detach any in-flight load for it, so a load that
+   * started before the delete can neither repopulate the key nor be joined
+   */
+  delete(key: K): boolean {
+    this.inflight.delete(key);
+    return this.entries.delete(key);
+  }
+
+  /**
+   * Get a cached value or load it. Concurrent callers for the same key
+   * share one in-flight load; failed loads are not cached, and a load
+   * superseded by delete() or clear() is returned but not cached.
+   */
+  async getOrLoad(key: K, loader: () => Promise<V>): Promise<V> {
+    const cached = this.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    const pending = this.inflight.get(key);
+    if (pending) {
+      return pending;
+    }
+
+    // The load is current only while it is still the key's in-flight entry
+    const load: Promise<V> = loader()
+      .then((value) => {
+        if (this.inflight.get(key) === load) {
+          this.set(key, value);
+        }
+        return value;
+      })
+      .finally(() => {
+        if (this.inflight.get(key) === load) {
+          this.inflight.delete(key);
+        }
+      });
+
+    this.inflight.set(key, load);
+    return load;
+  }
+
+  /**
+   * Clear all entries
+   */
+  clear(): void {
+    this.entries.clear();
+    this.inflight.clear();
+  }
+
+  /**
+   * Number of stored entries (including not-yet-purged expired ones)
+   */
+  get size(): number {
+    return this.entries.size;
+  }
+}
@@ -9,3 +9,4 @@ export * from './CircuitBreaker';
 export * from './ErrorLogger';
 export * from './InputValidator';
 export * from './RateLimiter';
+export * from './TTLCache';
@@ -0,0 +1,208 @@
+/**
+ * Unit Tests for MemoryManager
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { MemoryManager } from '../../agents/runtime/MemoryManager.js';
+import type { Transaction } from '../../src/stellar/xdr/types.js';
+
+describe('MemoryManager', () => {
+  const source = 'GBRPYHIL2CI3FNQ4BXLFMNDLFJUNPU2HY3ZMFSHONUCEOASW7QC7OX2H';
+  const alice = 'GA5ZSEJYB37JRC5AVCIA5MOP4RHTM335X2KGX3IHOJAPP5RE34K4KZVN';
+  const bob = 'GDQNY3PBOJOKYZSRMK2S7LHHGWZIUISD4QORETLMXEWXBI7KFZZMKTL3';
+
+  let memoryPath: string;
+  let memory: MemoryManager;
+
+  function tx(seqNum: number, destination: string = alice): Transaction {
+    return {
+      sourceAccount: source,
+      fee: 100,
+      seqNum: String(seqNum),
+      memo: { type: 0 } as any,
+      operations: [{ body: { type: 1 as any, data: { destination, amount: '1' } } }],
+    };
+  }
+
+  function outcome(timestamp: number, success: boolean = true) {
+    return { result: { success, hash: `hash-${timestamp}` }, timestamp };
+  }
+
+  beforeEach(async () => {
+    memoryPath = fs.mkdtempSync(path.join(os.tmpdir(), 'memory-'));
+    memory = new MemoryManager(memoryPath);
+    await memory.initialize();
+  });
+
+  afterEach(() => {
+    fs.rmSync(memoryPath, { recursive: true, force: true });
+  });
+
+  function savedTransactions(): unknown[] | undefined {
+    const file = path.join(memoryPath, 'transactions.json');
+    return fs.existsSync(file) ? JSON.parse(fs.readFileSync(file, 'utf-8')) : undefined;
+  }
+
+  describe('persistence', () => {
+    it('should save each record before resolving by default', async () => {
+      await memory.recordTransaction(tx(1), outcome(1000));
+
+      expect(savedTransactions()).toHaveLength(1);
+    });
+
+    it('should batch writes behind the window when write-behind is enabled', async () => {
+      const batched = new MemoryManager(memoryPath, { writeBehind: true });
+      await batched.initialize();
+
+      await batched.recordTransaction(tx(1), outcome(1000));
+      await batched.recordTransaction(tx(2), outcome(2000));
+      expect(savedTransactions()).toBeUndefined();
+
+      await vi.waitFor(() => expect(savedTransactions()).toHaveLength(2));
+    });
+
+    it('should honor sync with write-behind enabled', async () => {
+      const batched = new MemoryManager(memoryPath, { writeBehind: true });
+      await batched.initialize();
+
+      await batched.recordTransaction(tx(1), outcome(1000), { sync: true });
+
+      expect(savedTransactions()).toHaveLength(1);
+    });
+
+    it('should write pending records on flush', async () => {
+      const batched = new MemoryManager(memoryPath, { writeBehind: true });
+      await batched.initialize();
+
+      await batched.recordTransaction(tx(1), outcome(1000));
+      await batched.flush();
+
+      expect(savedTransactions()).toHaveLength(1);
+    });
+  });
+
+  describe('indexes', () => {
+    it('should keep one entry per transaction when it is re-recorded', async () => {
+      await memory.recordTransaction(tx(1), outcome(1000, false));
+      await memory.recordTransaction(tx(1), outcome(2000, true));
+
+      expect(await memory.getCounterpartyHistory(alice)).toHaveLength(1);
+      expect(await memory.queryHistory({ status: 'success' })).toHaveLength(1);
+      expect(await memory.queryHistory({ status: 'failed' })).toHaveLength(0);
+
+      const page = await memory.queryHistoryPage({}, 10);
+      expect(page.transactions).toHaveLength(1);
+      expect(await memory.queryHistoryPage({ endDate: new Date(1500) }, 10)).toEqual({
+        transactions: [],
+        nextCursor: undefined,
+      });
+    });
+
+    it('should move a re-recorded transaction to its new counterparty', async () => {
+      await memory.recordTransaction(tx(1, alice), outcome(1000));
+      await memory.recordTransaction(tx(1, bob), outcome(1000));
+
+      expect(await memory.getCounterpartyHistory(alice)).toHaveLength(0);
+      expect(await memory.getCounterpartyHistory(bob)).toHaveLength(1);
+    });
+
+    it('should rebuild the same indexes when loaded from disk', async () => {
+      await memory.recordTransactions([
+        { tx: tx(1), outcome: outcome(3000) },
+        { tx: tx(2), outcome: outcome(1000, false) },
+        { tx: tx(3, bob), outcome: outcome(2000) },
+      ]);
+      await memory.flush();
+
+      const reloaded = new MemoryManager(memoryPath);
+      await reloaded.initialize();
+
+      const seqNums = [...reloaded.iterateHistory()].map((t) => t.seqNum);
+      expect(seqNums).toEqual(['1', '3', '2']);
+      expect(await reloaded.queryHistory({ status: 'failed' })).toHaveLength(1);
+      expect(await reloaded.getCounterpartyHistory(alice)).toHaveLength(2);
+    });
+
+    it('should empty every index on clear', async () => {
+      await memory.recordTransaction(tx(1), outcome(1000));
+      await memory.clear();
+
+      expect(await memory.getCounterpartyHistory(alice)).toHaveLength(0);
+      expect(await memory.queryHistory({ status: 'success' })).toHaveLength(0);
+      expect([...memory.iterateHistory()]).toHaveLength(0);
+    });
+  });
+
+  describe('history pages', () => {
+    beforeEach(async () => {
+      // Three transactions share each timestamp; odd sequence numbers fail
+      const entries = [];
+      for (let seq = 1; seq <= 9; seq++) {
+        entries.push({ tx: tx(seq), outcome: outcome(1000 * Math.ceil(seq / 3), seq % 2 === 0) });
+      }
+      await memory.recordTransactions(entries);
+    });
+
+    async function allPages(filter: Parameters<MemoryManager['queryHistoryPage']>[0], limit: number) {
+      const seqNums: string[] = [];
+      let cursor: string | undefined;
+      do {
+        const page = await memory.queryHistoryPage(filter, limit, cursor);
+        seqNums.push(...page.transactions.map((t) => t.seqNum));
+        cursor = page.nextCursor;
+      } while (cursor);
+      return seqNums;
+    }
+
+    it('should page across equal timestamps without gaps or repeats', async () => {
+      expect(await allPages({}, 2)).toEqual(['9', '8', '7', '6', '5', '4', '3', '2', '1']);
+    });
+
+    it('should filter pages by status', async () => {
+      expect(await allPages({ status: 'success' }, 2)).toEqual(['8', '6', '4', '2']);
+      expect(await allPages({ status: 'failed' }, 2)).toEqual(['9', '7', '5', '3', '1']);
+    });
+
+    it('should keep every page within the start and end dates', async () => {
+      const filter = { startDate: new Date(2000), endDate: new Date(2000) };
+      expect(await allPages(filter, 2)).toEqual(['6', '5', '4']);
+    });
+
+    it('should not let a cursor reach past the end date', async () => {
+      const first = await memory.queryHistoryPage({}, 1);
+      const page = await memory.queryHistoryPage({ endDate: new Date(1000) }, 10, first.nextCursor);
+
+      expect(page.transactions.map((t) => t.seqNum)).toEqual(['3', '2', '1']);
+    });
+
+    it('should reject a malformed cursor', async () => {
+      await expect(memory.queryHistoryPage({}, 10, 'garbage')).rejects.toThrow('Invalid history cursor');
+      await expect(memory.queryHistoryPage({}, 10, 'abc:tx')).rejects.toThrow('Invalid history cursor');
+      await expect(memory.queryHistoryPage({}, 10, '1000:')).rejects.toThrow('Invalid history cursor');
+    });
+
+    it('should iterate the same order and filters as pages', async () => {
+      const iterated = (filter: Parameters<MemoryManager['iterateHistory']>[0]) =>
+        [...memory.iterateHistory(filter)].map((t) => t.seqNum);
+
+      expect(iterated({})).toEqual(await allPages({}, 4));
+      expect(iterated({ status: 'failed', endDate: new Date(2000) })).toEqual(['5', '3', '1']);
+      expect(iterated({ startDate: new Date(3000) })).toEqual(['9', '8', '7']);
+    });
+
+    it('should continue iterating past records written mid-iteration', async () => {
+      const seqNums: string[] = [];
+      for (const t of memory.iterateHistory({ startDate: new Date(3000) })) {
+        seqNums.push(t.seqNum);
+        if (t.seqNum === '9') {
+          await memory.recordTransaction(tx(10), outcome(5000));
+        }
+      }
+
+      expect(seqNums).toEqual(['9', '8', '7']);
+    });
+  });
+});
@@ -0,0 +1,78 @@
+/**
+ * Unit Tests for StellarClient balance caching
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import * as StellarSdk from '@stellar/stellar-sdk';
+import { StellarClient } from '../../src/stellar/StellarClient.js';
+
+describe('StellarClient', () => {
+  const destination = 'GA5ZSEJYB37JRC5AVCIA5MOP4RHTM335X2KGX3IHOJAPP5RE34K4KZVN';
+  const source = StellarSdk.Keypair.random();
+
+  let client: StellarClient;
+  let server: any;
+
+  function account(balance: string) {
+    return { balances: [{ asset_type: 'native', balance }] };
+  }
+
+  beforeEach(() => {
+    client = new StellarClient({ network: 'testnet' });
+    server = (client as any).server;
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('should not cache a balance read that was in flight when invalidated', async () => {
+    let resolveStale!: (value: unknown) => void;
+    const loadAccount = vi.spyOn(server, 'loadAccount')
+      .mockReturnValueOnce(new Promise((resolve) => (resolveStale = resolve)))
+      .mockResolvedValue(account('90'));
+
+    const stale = client.getBalance(source.publicKey());
+    client.invalidateBalance(source.publicKey());
+    resolveStale(account('100'));
+
+    expect(await stale).toBe(100);
+    expect(await client.getBalance(source.publicKey())).toBe(90);
+    expect(loadAccount).toHaveBeenCalledTimes(2);
+  });
+
+  it('should invalidate balances when a failed submission still charged a fee', async () => {
+    const loadAccount = vi.spyOn(server, 'loadAccount')
+      .mockResolvedValueOnce(account('100'))
+      .mockResolvedValue(account('99.99999'));
+    vi.spyOn(server, 'submitTransaction').mockRejectedValue(
+      Object.assign(new Error('Request failed with status code 400'), {
+        response: { status: 400, data: { extras: { result_codes: { transaction: 'tx_failed' } } } },
+      })
+    );
+
+    const tx = new StellarSdk.TransactionBuilder(new StellarSdk.Account(source.publicKey(), '1'), {
+      fee: '100',
+      networkPassphrase: StellarSdk.Networks.TESTNET,
+    })
+      .addOperation(
+        StellarSdk.Operation.payment({ destination, asset: StellarSdk.Asset.native(), amount: '1' })
+      )
+      .setTimeout(30)
+      .build();
+    tx.sign(source);
+
+    expect(await client.getBalance(source.publicKey())).toBe(100);
+
+    const result = await client.broadcastTransaction({
+      transaction: {} as any,
+      signature: '',
+      hash: tx.hash().toString('hex'),
+      envelopeXdr: tx.toXDR(),
+    });
+
+    expect(result.success).toBe(false);
+    expect(await client.getBalance(source.publicKey())).toBe(99.99999);
+    expect(loadAccount).toHaveBeenCalledTimes(2);
+  });
+});
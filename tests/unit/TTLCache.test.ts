@@ -0,0 +1,127 @@
+/**
+ * Unit Tests for TTLCache
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { TTLCache } from '../../src/utils/TTLCache';
+
+describe('TTLCache', () => {
+  let now: number;
+
+  beforeEach(() => {
+    now = 1000;
+    vi.spyOn(performance, 'now').mockImplementation(() => now);
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  describe('get/set', () => {
+    it('should return stored values before expiry', () => {
+      const cache = new TTLCache<string, number>(500);
+      cache.set('a', 1);
+
+      now += 499;
+      expect(cache.get('a')).toBe(1);
+    });
+
+    it('should expire values after ttl', () => {
+      const cache = new TTLCache<string, number>(500);
+      cache.set('a', 1);
+
+      now += 500;
+      expect(cache.get('a')).toBeUndefined();
+      expect(cache.size).toBe(0);
+    });
+
+    it('should honour per-entry ttl', () => {
+      const cache = new TTLCache<string, number>(500);
+      cache.set('a', 1, 2000);
+
+      now += 1000;
+      expect(cache.get('a')).toBe(1);
+    });
+
+    it('should evict the oldest entry when full', () => {
+      const cache = new TTLCache<string, number>(500, 2);
+      cache.set('a', 1);
+      cache.set('b', 2);
+      cache.set('c', 3);
+
+      expect(cache.has('a')).toBe(false);
+      expect(cache.get('b')).toBe(2);
+      expect(cache.get('c')).toBe(3);
+    });
+  });
+
+  describe('getOrLoad', () => {
+    it('should share one load between concurrent callers', async () => {
+      const cache = new TTLCache<string, string>(500);
+      const loader = vi.fn().mockResolvedValue('value');
+
+      const [first, second] = await Promise.all([
+        cache.getOrLoad('key', loader),
+        cache.getOrLoad('key', loader),
+      ]);
+
+      expect(first).toBe('value');
+      expect(second).toBe('value');
+      expect(loader).toHaveBeenCalledTimes(1);
+    });
+
+    it('should reload after expiry', async () => {
+      const cache = new TTLCache<string, string>(500);
+      const loader = vi.fn().mockResolvedValueOnce('first').mockResolvedValueOnce('second');
+
+      expect(await cache.getOrLoad('key', loader)).toBe('first');
+      now += 500;
+      expect(await cache.getOrLoad('key', loader)).toBe('second');
+    });
+
+    it('should not cache failed loads', async () => {
+      const cache = new TTLCache<string, string>(500);
+      const loader = vi.fn()
+        .mockRejectedValueOnce(new Error('upstream down'))
+        .mockResolvedValue('value');
+
+      await expect(cache.getOrLoad('key', loader)).rejects.toThrow('upstream down');
+      expect(await cache.getOrLoad('key', loader)).toBe('value');
+      expect(loader).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not cache a load that was pending when the key was deleted', async () => {
+      const cache = new TTLCache<string, string>(500);
+      let resolveStale!: (value: string) => void;
+      const loader = vi.fn()
+        .mockReturnValueOnce(new Promise<string>((resolve) => (resolveStale = resolve)))
+        .mockResolvedValue('fresh');
+
+      const stale = cache.getOrLoad('key', loader);
+      cache.delete('key');
+
+      // A load after the delete starts over instead of joining the stale one
+      expect(await cache.getOrLoad('key', loader)).toBe('fresh');
+
+      resolveStale('stale');
+      expect(await stale).toBe('stale');
+      expect(cache.get('key')).toBe('fresh');
+      expect(loader).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not cache a load that was pending when the cache was cleared', async () => {
+      const cache = new TTLCache<string, string>(500);
+      let resolveStale!: (value: string) => void;
+      const loader = vi.fn().mockReturnValueOnce(
+        new Promise<string>((resolve) => (resolveStale = resolve))
+      );
+
+      const stale = cache.getOrLoad('key', loader);
+      cache.clear();
+      resolveStale('stale');
+      await stale;
+
+      expect(cache.get('key')).toBeUndefined();
+    });
+  });
+});
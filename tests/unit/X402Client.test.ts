@@ -0,0 +1,97 @@
+/**
+ * Unit Tests for X402Client HTTP retries
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { X402Client } from '../../protocols/x402/X402Client.js';
+
+describe('X402Client', () => {
+  const url = 'http://resource.test/data';
+
+  let client: X402Client;
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  function socketError(code: string): TypeError {
+    return new TypeError('fetch failed', { cause: Object.assign(new Error(code), { code }) });
+  }
+
+  function ok(): Response {
+    return new Response(JSON.stringify({ ok: true }), { status: 200 });
+  }
+
+  beforeEach(() => {
+    fetchMock = vi.fn();
+    vi.stubGlobal('fetch', fetchMock);
+    client = new X402Client({} as any, {} as any);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  describe('idempotent requests', () => {
+    it.each(['ECONNRESET', 'UND_ERR_SOCKET'])('should retry after %s', async (code) => {
+      fetchMock.mockRejectedValueOnce(socketError(code)).mockResolvedValueOnce(ok());
+
+      const response = await client.request({ url, method: 'GET' } as any);
+
+      expect(response.statusCode).toBe(200);
+      expect(response.body).toEqual({ ok: true });
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+
+    it.each([502, 503, 504])('should retry a %d response', async (status) => {
+      fetchMock.mockResolvedValueOnce(new Response(null, { status })).mockResolvedValueOnce(ok());
+
+      const response = await client.request({ url, method: 'GET' } as any);
+
+      expect(response.statusCode).toBe(200);
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+
+    it('should return the last gateway error once retries are exhausted', async () => {
+      fetchMock.mockImplementation(async () => new Response(null, { status: 503 }));
+
+      const response = await client.request({ url, method: 'GET' } as any);
+
+      expect(response.statusCode).toBe(503);
+      expect(fetchMock).toHaveBeenCalledTimes(3);
+    });
+
+    it('should not retry errors that are not connection failures', async () => {
+      fetchMock.mockRejectedValue(new TypeError('Invalid URL'));
+
+      await expect(client.request({ url, method: 'GET' } as any)).rejects.toThrow('HTTP request failed');
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('non-idempotent requests', () => {
+    it('should retry when the connection was refused', async () => {
+      fetchMock.mockRejectedValueOnce(socketError('ECONNREFUSED')).mockResolvedValueOnce(ok());
+
+      const response = await client.request({ url, method: 'POST', body: { a: 1 } } as any);
+
+      expect(response.statusCode).toBe(200);
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not retry a reset that may follow delivery', async () => {
+      fetchMock.mockRejectedValueOnce(socketError('ECONNRESET')).mockResolvedValueOnce(ok());
+
+      await expect(
+        client.request({ url, method: 'POST', body: { a: 1 } } as any)
+      ).rejects.toThrow('HTTP request failed');
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not retry a gateway error', async () => {
+      fetchMock.mockResolvedValueOnce(new Response(null, { status: 503 })).mockResolvedValueOnce(ok());
+
+      const response = await client.request({ url, method: 'POST', body: { a: 1 } } as any);
+
+      expect(response.statusCode).toBe(503);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+  });
+});
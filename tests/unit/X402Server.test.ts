@@ -0,0 +1,104 @@
+/**
+ * Unit Tests for X402Server payment proof verification
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { Keypair } from '@stellar/stellar-sdk';
+import { X402Server } from '../../protocols/x402/X402Server.js';
+import { proofMessage } from '../../protocols/x402/signing.js';
+import type { PaymentProof, UnsignedPaymentProof } from '../../protocols/x402/types.js';
+
+describe('X402Server', () => {
+  const recipient = 'GA5ZSEJYB37JRC5AVCIA5MOP4RHTM335X2KGX3IHOJAPP5RE34K4KZVN';
+  const txHash = 'a'.repeat(64);
+  const payer = Keypair.random();
+
+  let server: X402Server;
+  let stellarClient: { getTransactionStatus: ReturnType<typeof vi.fn> };
+
+  function sign(requestId: string, proof: UnsignedPaymentProof, keypair: Keypair = payer): PaymentProof {
+    return {
+      ...proof,
+      payer: keypair.publicKey(),
+      signature: keypair.sign(proofMessage(requestId, proof)).toString('base64'),
+    };
+  }
+
+  beforeEach(() => {
+    stellarClient = {
+      getTransactionStatus: vi.fn().mockResolvedValue({
+        success: true,
+        hash: txHash,
+        ledger: 1,
+        sourceAccount: payer.publicKey(),
+      }),
+    };
+    server = new X402Server(
+      { acceptChannels: true, paymentTimeout: 60_000 } as any,
+      stellarClient as any
+    );
+  });
+
+  it('should accept an on-chain proof signed by the paying account', async () => {
+    const { requestId } = server.requirePayment(1, recipient);
+    const proof = sign(requestId, { type: 'on-chain', transactionHash: txHash, timestamp: Date.now() });
+
+    const result = await server.verifyPayment(requestId, proof);
+
+    expect(result.verified).toBe(true);
+  });
+
+  it('should reject a proof without a signature', async () => {
+    const { requestId } = server.requirePayment(1, recipient);
+    const { signature: _signature, ...unsigned } = sign(requestId, {
+      type: 'on-chain',
+      transactionHash: txHash,
+      timestamp: Date.now(),
+    });
+
+    const result = await server.verifyPayment(requestId, unsigned as PaymentProof);
+
+    expect(result.verified).toBe(false);
+    expect(stellarClient.getTransactionStatus).not.toHaveBeenCalled();
+  });
+
+  it('should reject a proof whose reference was changed after signing', async () => {
+    const { requestId } = server.requirePayment(1, recipient);
+    const proof = sign(requestId, { type: 'on-chain', transactionHash: txHash, timestamp: Date.now() });
+
+    const result = await server.verifyPayment(requestId, { ...proof, transactionHash: 'b'.repeat(64) });
+
+    expect(result.verified).toBe(false);
+    expect(result.message).toBe('Invalid payment proof signature');
+    expect(stellarClient.getTransactionStatus).not.toHaveBeenCalled();
+  });
+
+  it('should reject a valid signature from a key that did not pay', async () => {
+    const { requestId } = server.requirePayment(1, recipient);
+    const proof = sign(
+      requestId,
+      { type: 'on-chain', transactionHash: txHash, timestamp: Date.now() },
+      Keypair.random()
+    );
+
+    const result = await server.verifyPayment(requestId, proof);
+
+    expect(result.verified).toBe(false);
+    expect(result.message).toContain('does not match transaction source');
+  });
+
+  it('should accept a signed channel proof', async () => {
+    const { requestId } = server.requirePayment(1, recipient);
+    const channelState = {
+      channelId: 'channel-1',
+      participants: [payer.publicKey(), recipient],
+      balances: [5, 5],
+      nonce: 1,
+      signatures: ['sig-a', 'sig-b'],
+    };
+
+    const genuine = sign(requestId, { type: 'channel', channelState, timestamp: Date.now() });
+    const genuineResult = await server.verifyPayment(requestId, genuine);
+    expect(genuineResult.verified).toBe(true);
+  });
+});
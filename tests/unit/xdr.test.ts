@@ -12,10 +12,13 @@ import {
   MemoType,
   AssetType,
 } from '../../src/stellar/xdr/index.js';
+import { generateTestSecret } from '../helpers/test-keys.js';
 
 describe('XDR Serialization', () => {
   const testSourceAccount = 'GBRPYHIL2CI3FNQ4BXLFMNDLFJUNPU2HY3ZMFSHONUCEOASW7QC7OX2H';
   const testDestination = 'GA5ZSEJYB37JRC5AVCIA5MOP4RHTM335X2KGX3IHOJAPP5RE34K4KZVN';
+  // Derived once and shared; key derivation is the costly part of each test
+  const sourceKeypair = StellarSdk.Keypair.fromSecret(generateTestSecret());
 
   describe('Transaction Encoding', () => {
     it('should encode a simple payment transaction', () => {
@@ -106,10 +109,6 @@ describe('XDR Serialization', () => {
   describe('Transaction Decoding', () => {
     it('should decode an encoded transaction', () => {
       // Create a transaction using Stellar SDK
-      const sourceKeypair = StellarSdk.Keypair.fromSecret(
-        'SCZANGBA5YHTNYVVV4C3U252E2B6P6F5T3U6MM63WBSBZATAQI3EBTQ4'
-      );
-      
       const account = new StellarSdk.Account(sourceKeypair.publicKey(), '1');
       
       const transaction = new StellarSdk.TransactionBuilder(account, {
@@ -136,10 +135,6 @@ describe('XDR Serialization', () => {
     });
 
     it('should decode transaction with memo', () => {
-      const sourceKeypair = StellarSdk.Keypair.fromSecret(
-        'SCZANGBA5YHTNYVVV4C3U252E2B6P6F5T3U6MM63WBSBZATAQI3EBTQ4'
-      );
-      
       const account = new StellarSdk.Account(sourceKeypair.publicKey(), '1');
       
       const transaction = new StellarSdk.TransactionBuilder(account, {
@@ -172,10 +167,6 @@ describe('XDR Serialization', () => {
 
   describe('XDR Validation', () => {
     it('should validate correct XDR', () => {
-      const sourceKeypair = StellarSdk.Keypair.fromSecret(
-        'SCZANGBA5YHTNYVVV4C3U252E2B6P6F5T3U6MM63WBSBZATAQI3EBTQ4'
-      );
-      
       const account = new StellarSdk.Account(sourceKeypair.publicKey(), '1');
       
       const transaction = new StellarSdk.TransactionBuilder(account, {